@@ -1,12 +1,30 @@
 # app.py
+import csv
+import io
+import itertools
 import json
 import os
-from datetime import datetime
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
 from functools import wraps
 
-import requests
+import click
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import (
+    Flask,
+    Response,
+    g,
+    has_request_context,
+    jsonify,
+    request,
+    session,
+    stream_with_context,
+)
 from flask_bcrypt import Bcrypt
 from flask_login import (
     LoginManager,
@@ -18,13 +36,62 @@ from flask_login import (
 )
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, insert, inspect, update
+from sqlalchemy.orm import validates
+
+from cache import ResponseCache
+from events import CHANNEL, EventBroker, PgListener, encode_event
+from profiling import (
+    ProfileStore,
+    RequestProfile,
+    folded_stacks,
+    propagate,
+    record_provider_call,
+)
+from providers import CircuitBreaker, ProviderClient
+from suggest import RANKINGS, SUGGEST_KINDS, SuggestIndex
 
 load_dotenv()
 
+
+def engine_options(url):
+    """SQLAlchemy engine options (pooling, pre-ping, statement timeout) from env"""
+    options = {"pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true") == "true"}
+    if url.startswith("sqlite"):
+        return options
+
+    options.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    )
+    statement_timeout = os.getenv("DB_STATEMENT_TIMEOUT_MS")
+    if statement_timeout and url.startswith("postgresql"):
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={int(statement_timeout)}"
+        }
+    return options
+
+
 app = Flask(__name__)
 app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv(
     "DATABASE_URL", "postgresql://postgres:postgres@db:5432/moviedb"
 )
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(
+    app.config["SQLALCHEMY_DATABASE_URI"]
+)
+# Optional read-only replica that GET endpoints decorated with @read_replica use
+if os.getenv("DATABASE_READ_URL"):
+    app.config["SQLALCHEMY_BINDS"] = {
+        "replica": {
+            "url": os.getenv("DATABASE_READ_URL"),
+            **engine_options(os.getenv("DATABASE_READ_URL")),
+        }
+    }
+# After a write, keep that client's reads on the primary for this long
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "your-secret-key-change-this")
 
@@ -35,7 +102,35 @@ app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "your-secret-key-change-this"
 #      allow_headers=["Content-Type", "Authorization"],
 #      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
 
-db = SQLAlchemy(app)
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica bind when the current request allows"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and has_request_context()
+            and g.get("read_replica")
+        ):
+            return self._db.engines["replica"]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def mark_primary_write(session, flush_context):
+    if has_request_context():
+        g.db_write = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def mark_bulk_write(orm_execute_state):
+    # Bulk UPDATE/INSERT/DELETE statements don't go through a flush
+    if not orm_execute_state.is_select and has_request_context():
+        g.db_write = True
+
+
+db = SQLAlchemy(app, session_options={"class_": RoutingSession})
 migrate = Migrate(app, db)
 bcrypt = Bcrypt(app)
 login_manager = LoginManager(app)
@@ -53,11 +148,87 @@ def after_request(response):
         response.headers["Access-Control-Allow-Origin"] = "*"
 
     response.headers["Access-Control-Allow-Credentials"] = "true"
-    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
+    response.headers["Access-Control-Allow-Headers"] = (
+        "Content-Type, Authorization, X-Profile"
+    )
+    response.headers["Access-Control-Allow-Methods"] = (
+        "GET, POST, PUT, PATCH, DELETE, OPTIONS"
+    )
+    response.headers["Access-Control-Expose-Headers"] = (
+        "X-Cache, X-Collection-Generation, X-Profile-Id"
+    )
+    return response
+
+
+# Read-your-writes: pin a client to the primary for a moment after it writes
+# (and have it read the collection generation fresh, see collection_generation)
+@app.after_request
+def remember_primary_write(response):
+    if g.get("db_write"):
+        session["primary_until"] = time.time() + DB_REPLICA_STICKY_SECONDS
+    return response
+
+
+def read_replica(f):
+    """Serve this view's GET requests from the read replica when one is configured"""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if (
+            request.method == "GET"
+            and "replica" in app.config.get("SQLALCHEMY_BINDS", {})
+            and session.get("primary_until", 0) < time.time()
+        ):
+            g.read_replica = True
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+# Admin-only request profiling: add ?_profile=1 or an "X-Profile: 1" header
+PROFILE_DIR = os.getenv("PROFILE_DIR", "/tmp/movie_db_profiles")
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+profile_store = ProfileStore(PROFILE_DIR, keep=int(os.getenv("PROFILE_KEEP", "100")))
+
+
+@app.before_request
+def start_profile():
+    flag = request.args.get("_profile") or request.headers.get("X-Profile", "")
+    if flag.lower() not in ("1", "true", "yes"):
+        return
+    # Silently ignored for everyone but admins
+    if current_user.is_authenticated and current_user.has_role("admin"):
+        g.profile = RequestProfile(interval=PROFILE_INTERVAL_MS / 1000)
+        g.profile.start()
+
+
+@app.after_request
+def finish_profile(response):
+    profile = g.pop("profile", None)
+    if profile is None:
+        return response
+    profile.stop()
+    profile_store.save(
+        profile.to_dict(
+            method=request.method,
+            path=request.path,
+            query={k: v for k, v in request.args.items() if k != "_profile"},
+            status=response.status_code,
+            user=current_user.username,
+        )
+    )
+    response.headers["X-Profile-Id"] = profile.id
     return response
 
 
+@app.teardown_request
+def discard_profile(exc):
+    # Stop the sampler if the request failed before after_request ran
+    profile = g.pop("profile", None)
+    if profile is not None:
+        profile.stop()
+
+
 # Helper function to add CORS headers
 def add_cors_headers(response, origin=None):
     """Add CORS headers to response"""
@@ -68,8 +239,12 @@ def add_cors_headers(response, origin=None):
         response.headers["Access-Control-Allow-Origin"] = "*"
 
     response.headers["Access-Control-Allow-Credentials"] = "true"
-    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
+    response.headers["Access-Control-Allow-Headers"] = (
+        "Content-Type, Authorization, X-Profile"
+    )
+    response.headers["Access-Control-Allow-Methods"] = (
+        "GET, POST, PUT, PATCH, DELETE, OPTIONS"
+    )
     return response
 
 
@@ -136,12 +311,13 @@ def auth_required(f):
 
 class Movie(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(255), nullable=False)
-    year = db.Column(db.String(4))
+    title = db.Column(db.String(255), nullable=False, index=True)
+    year = db.Column(db.String(4), index=True)
     genre = db.Column(db.String(255))
     director = db.Column(db.String(255))
     actors = db.Column(db.Text)
     imdb_score = db.Column(db.String(10))
+    imdb_rating = db.Column(db.Float, index=True)  # Numeric imdb_score for sorting
     rotten_tomatoes_score = db.Column(db.String(10))
     metacritic_score = db.Column(db.String(10))  # Added Metacritic support
     plot = db.Column(db.Text)
@@ -149,11 +325,11 @@ class Movie(db.Model):
     runtime = db.Column(db.String(10))  # Runtime in minutes, e.g., "148 min"
 
     # New fields for enhanced functionality
-    personal_rating = db.Column(db.Float)  # 1-5 stars
+    personal_rating = db.Column(db.Float, index=True)  # 1-5 stars
     tags = db.Column(db.Text)  # JSON string of tags ["favorite", "watchlist", etc.]
     notes = db.Column(db.Text)  # Personal notes/review
     watched = db.Column(db.Boolean, default=False)
-    date_added = db.Column(db.DateTime, default=db.func.current_timestamp())
+    date_added = db.Column(db.DateTime, default=db.func.current_timestamp(), index=True)
     date_watched = db.Column(db.DateTime)
 
     # Lending tracking
@@ -162,17 +338,48 @@ class Movie(db.Model):
     date_lent = db.Column(db.DateTime)  # When it was lent
 
     # TMDB enhanced data storage
-    tmdb_id = db.Column(db.Integer)  # TMDB movie ID
+    tmdb_id = db.Column(db.Integer, index=True)  # TMDB movie ID
+    imdb_id = db.Column(db.String(20), index=True)  # IMDb ID, e.g. "tt1375666"
     backdrop_url = db.Column(db.String(512))  # High-res backdrop image
-    tmdb_rating = db.Column(db.Float)  # TMDB community rating
+    tmdb_rating = db.Column(db.Float, index=True)  # TMDB community rating
     tmdb_vote_count = db.Column(db.Integer)  # Number of votes
     cast_data = db.Column(db.Text)  # JSON string of cast info
     trailers_data = db.Column(db.Text)  # JSON string of trailers
     similar_movies_data = db.Column(db.Text)  # JSON string of similar movies
+    last_enriched_at = db.Column(db.DateTime, index=True)  # Last provider fetch
 
     # Movie sources (JSON array)
     sources = db.Column(db.Text)  # JSON string of sources ["Apple TV", "UHD Disk"]
 
+    # Indexed copies of tags/sources, kept in sync by sync_movie_labels()
+    tag_links = db.relationship("MovieTag", cascade="all, delete-orphan")
+    source_links = db.relationship("MovieSource", cascade="all, delete-orphan")
+
+    # Descending sorts put missing values last; on PostgreSQL that ordering
+    # needs its own index (SQLite can't declare NULLS LAST in an index)
+    __table_args__ = (
+        db.Index(
+            "ix_movie_date_added_desc", date_added.desc().nulls_last(), id.desc()
+        ).ddl_if(dialect="postgresql"),
+        db.Index(
+            "ix_movie_personal_rating_desc",
+            personal_rating.desc().nulls_last(),
+            id.desc(),
+        ).ddl_if(dialect="postgresql"),
+        db.Index(
+            "ix_movie_imdb_rating_desc", imdb_rating.desc().nulls_last(), id.desc()
+        ).ddl_if(dialect="postgresql"),
+        db.Index(
+            "ix_movie_tmdb_rating_desc", tmdb_rating.desc().nulls_last(), id.desc()
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    @validates("imdb_score")
+    def update_imdb_rating(self, key, value):
+        # Keep the numeric copy used for sorting and rating filters in sync
+        self.imdb_rating = parse_imdb_rating(value)
+        return value
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -201,6 +408,7 @@ class Movie(db.Model):
             "sources": json.loads(self.sources) if self.sources else [],
             # TMDB enhanced data
             "tmdb_id": self.tmdb_id,
+            "imdb_id": self.imdb_id,
             "backdrop_url": self.backdrop_url,
             "tmdb_rating": self.tmdb_rating,
             "tmdb_vote_count": self.tmdb_vote_count,
@@ -211,9 +419,490 @@ class Movie(db.Model):
             "similar_movies_data": json.loads(self.similar_movies_data)
             if self.similar_movies_data
             else [],
+            "last_enriched_at": self.last_enriched_at.isoformat()
+            if self.last_enriched_at
+            else None,
         }
 
 
+class MovieTag(db.Model):
+    """One row per (movie, tag) so tag lookups can use an index"""
+
+    movie_id = db.Column(
+        db.Integer, db.ForeignKey("movie.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag = db.Column(db.String(100), primary_key=True)  # Normalized to lowercase
+
+    __table_args__ = (db.Index("ix_movie_tag_tag", "tag", "movie_id"),)
+
+
+class MovieSource(db.Model):
+    """One row per (movie, source) so source lookups can use an index"""
+
+    movie_id = db.Column(
+        db.Integer, db.ForeignKey("movie.id", ondelete="CASCADE"), primary_key=True
+    )
+    source = db.Column(db.String(100), primary_key=True)
+
+    __table_args__ = (db.Index("ix_movie_source_source", "source", "movie_id"),)
+
+
+class CollectionState(db.Model):
+    """Single row whose generation is bumped by every transaction that changes movies"""
+
+    id = db.Column(db.Integer, primary_key=True)
+    generation = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+@event.listens_for(CollectionState.__table__, "after_create")
+def seed_collection_state(table, connection, **kw):
+    # Seeded once, so concurrent first writes both find a row to UPDATE
+    connection.execute(table.insert().values(id=1, generation=0))
+
+
+# Collection generation: response cache keys and the typeahead index follow it
+COLLECTION_MODELS = (Movie, MovieTag, MovieSource)
+COLLECTION_TABLES = {model.__table__.name for model in COLLECTION_MODELS}
+# Other workers' writes become visible to this worker's cache after this long
+CACHE_GENERATION_TTL = float(os.getenv("CACHE_GENERATION_TTL", "1"))
+generation_memo = {}  # "primary" / "replica" -> (generation, read at)
+
+# Live change events for /movies/events, see collection_change_message
+event_broker = EventBroker()
+pg_listener = PgListener(event_broker)
+# Row fields left out of events, clients load them with the movie details
+EVENT_OMITTED_FIELDS = ("cast_data", "trailers_data", "similar_movies_data")
+STATS_FIELDS = ("genre", "year", "director")
+
+response_cache = ResponseCache(
+    max_bytes=int(os.getenv("CACHE_MAX_MB", "64")) * 1024 * 1024,
+    redis_url=os.getenv("CACHE_REDIS_URL"),
+    ttl=int(os.getenv("CACHE_TTL", "3600")),
+)
+
+
+def collection_generation():
+    """
+    Current collection generation, read through the same bind as the request's
+    data and memoized for CACHE_GENERATION_TTL seconds
+    Clients that just wrote always read it fresh from the primary
+    """
+    bind = "replica" if has_request_context() and g.get("read_replica") else "primary"
+    recent_write = (
+        has_request_context() and session.get("primary_until", 0) > time.time()
+    )
+    memo = generation_memo.get(bind)
+    if memo and not recent_write and time.monotonic() - memo[1] < CACHE_GENERATION_TTL:
+        return memo[0]
+    generation = (
+        db.session.execute(
+            db.select(CollectionState.generation).where(CollectionState.id == 1)
+        ).scalar()
+        or 0
+    )
+    generation_memo[bind] = (generation, time.monotonic())
+    return generation
+
+
+def movie_stats_counts(genre, year, director):
+    """What one movie contributes to each /movies/stats distribution"""
+    counts = {"genres": {}, "decades": {}, "top_directors": {}}
+    if genre:
+        for name in genre.split(", "):
+            name = name.strip()
+            counts["genres"][name] = counts["genres"].get(name, 0) + 1
+    if year:
+        counts["decades"][f"{year[:3]}0s"] = 1
+    if director:
+        counts["top_directors"][director] = 1
+    return counts
+
+
+def add_stats_delta(delta, fields, sign):
+    """Add (sign=1) or remove (sign=-1) one movie's stats contribution"""
+    if fields is None:
+        return
+    delta["total_movies"] = delta.get("total_movies", 0) + sign
+    counts = movie_stats_counts(*(fields[field] for field in STATS_FIELDS))
+    for distribution, values in counts.items():
+        target = delta.setdefault(distribution, {})
+        for key, count in values.items():
+            target[key] = target.get(key, 0) + sign * count
+
+
+def previous_value(obj, field):
+    """Value of an attribute before the pending flush changed it"""
+    history = inspect(obj).attrs[field].history
+    return history.deleted[0] if history.deleted else getattr(obj, field)
+
+
+def record_movie_event(session, movie_id, before, movie):
+    # The first snapshot of a transaction is the "before" state, the last the "after"
+    entry = session.info.setdefault("movie_events", {}).setdefault(
+        movie_id, {"before": before}
+    )
+    entry["after"] = None
+    if movie is not None:
+        entry["after"] = {
+            key: value
+            for key, value in movie.to_dict().items()
+            if key not in EVENT_OMITTED_FIELDS
+        }
+
+
+def collection_change_message(session, generation):
+    """
+    The event sent to /movies/events subscribers for one committed transaction:
+    the created, updated and deleted movies plus the change to /movies/stats
+    Bulk writes can't list their rows, so they ask clients to reload instead
+    """
+    events = session.info.get("movie_events", {})
+    if session.info.get("collection_bulk") or not events:
+        return {"generation": generation, "invalidate": True}
+    changes, stats = [], {}
+    for movie_id, entry in events.items():
+        before, after = entry["before"], entry["after"]
+        if before is None and after is None:
+            continue  # Created and deleted in the same transaction
+        if before is None:
+            changes.append({"type": "created", "movie": after})
+        elif after is None:
+            changes.append({"type": "deleted", "id": movie_id})
+        else:
+            changes.append({"type": "updated", "movie": after})
+        add_stats_delta(stats, before, -1)
+        add_stats_delta(stats, after, 1)
+    stats = {
+        key: value
+        if key == "total_movies"
+        else {name: count for name, count in value.items() if count}
+        for key, value in stats.items()
+    }
+    return {"generation": generation, "changes": changes, "stats": stats}
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def collect_collection_changes(session, flush_context):
+    # Snapshot rows now, they are expired (and unreadable) after the commit
+    changes = session.info.setdefault("suggest_changes", {})
+    for obj in session.new:
+        if isinstance(obj, COLLECTION_MODELS):
+            session.info["collection_changed"] = True
+        if isinstance(obj, Movie):
+            changes[obj.id] = suggest_row(obj)
+            record_movie_event(session, obj.id, None, obj)
+    for obj in session.dirty:
+        if not isinstance(obj, COLLECTION_MODELS) or not session.is_modified(obj):
+            continue
+        session.info["collection_changed"] = True
+        if isinstance(obj, Movie):
+            if any(
+                inspect(obj).attrs[field].history.has_changes()
+                for field in SUGGEST_FIELDS
+            ):
+                changes[obj.id] = suggest_row(obj)
+            before = {field: previous_value(obj, field) for field in STATS_FIELDS}
+            record_movie_event(session, obj.id, before, obj)
+    for obj in session.deleted:
+        if isinstance(obj, COLLECTION_MODELS):
+            session.info["collection_changed"] = True
+        if isinstance(obj, Movie):
+            changes[obj.id] = None
+            before = {field: getattr(obj, field) for field in STATS_FIELDS}
+            record_movie_event(session, obj.id, before, None)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def collect_collection_bulk_write(orm_execute_state):
+    table = getattr(orm_execute_state.statement, "table", None)
+    if (
+        orm_execute_state.is_select
+        or table is None
+        or table.name not in COLLECTION_TABLES
+    ):
+        return
+    orm_execute_state.session.info["collection_changed"] = True
+    orm_execute_state.session.info["collection_bulk"] = True
+    # Bulk statements don't say which movies changed, rebuild the typeahead index
+    if table.name == Movie.__table__.name:
+        orm_execute_state.session.info["suggest_stale"] = True
+
+
+@event.listens_for(RoutingSession, "before_commit")
+def bump_collection_generation(session):
+    # Flush first so the pending changes are seen by collect_collection_changes
+    session.flush()
+    if not session.info.get("collection_changed"):
+        return
+    # Always on the primary, in the same transaction as the writes
+    generation = session.execute(
+        update(CollectionState)
+        .where(CollectionState.id == 1)
+        .values(generation=CollectionState.generation + 1)
+        .returning(CollectionState.generation),
+        bind_arguments={"bind": db.engine},
+    ).scalar()
+    if generation is None:
+        # Only for a table created before the row was seeded
+        generation = 1
+        session.add(CollectionState(id=1, generation=generation))
+        session.flush()
+    session.info["generation"] = generation
+
+    message = collection_change_message(session, generation)
+    if db.engine.dialect.name == "postgresql":
+        # Delivered to every worker's listener if, and only when, this commits
+        session.execute(
+            db.select(db.func.pg_notify(CHANNEL, encode_event(message))),
+            bind_arguments={"bind": db.engine},
+        )
+    else:
+        session.info["event_message"] = message
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def apply_collection_changes(session):
+    changes = session.info.pop("suggest_changes", {})
+    suggest_stale = session.info.pop("suggest_stale", False)
+    for key in ("collection_changed", "collection_bulk", "movie_events"):
+        session.info.pop(key, None)
+    generation = session.info.pop("generation", None)
+    if generation is None:
+        return
+    message = session.info.pop("event_message", None)
+    if message is not None:
+        event_broker.publish(message)
+    memo = generation_memo.get("primary")
+    if memo is None or memo[0] < generation:
+        generation_memo["primary"] = (generation, time.monotonic())
+    if suggest_stale:
+        suggest_index.invalidate()
+        rebuild_suggest_index_in_background()
+    else:
+        suggest_index.apply(changes, generation - 1, generation)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def discard_collection_changes(session):
+    for key in (
+        "suggest_changes",
+        "suggest_stale",
+        "collection_changed",
+        "collection_bulk",
+        "movie_events",
+        "generation",
+        "event_message",
+    ):
+        session.info.pop(key, None)
+
+
+def cached_response(f):
+    """Serve this view's GET responses from the response cache"""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if request.method != "GET":
+            return f(*args, **kwargs)
+        if g.get("profile") is not None:
+            # A profile of a cache hit would show none of the work being profiled
+            response = app.make_response(f(*args, **kwargs))
+            response.headers["X-Cache"] = "bypass"
+            return response
+        query = sorted(
+            (key, sorted(request.args.getlist(key)))
+            for key in request.args
+            if key != "_profile"
+        )
+        generation = collection_generation()
+        key = (
+            f"{request.endpoint}:{generation}:"
+            f"{json.dumps([kwargs, query], sort_keys=True)}"
+        )
+        cached = response_cache.get(key)
+        if cached is not None:
+            status, mimetype, body = cached
+            response = Response(body, status=status, mimetype=mimetype)
+            response.headers["X-Cache"] = "hit"
+        else:
+            response = app.make_response(f(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            response_cache.set(key, 200, response.mimetype, response.get_data())
+            response.headers["X-Cache"] = "miss"
+        # Lets /movies/events clients tell which changes this response includes
+        response.headers["X-Collection-Generation"] = str(generation)
+        return response
+
+    return decorated_function
+
+
+def parse_imdb_rating(value):
+    """Numeric value of an IMDB score such as "8.8" or "8.8/10" (None if unrated)"""
+    try:
+        return float(str(value).split("/")[0])
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_tags(value):
+    """Split a stored tags value (comma separated or JSON list) into unique tags"""
+    if not value:
+        return []
+    items = value
+    if isinstance(value, str):
+        items = value.split(",")
+        if value.lstrip().startswith("["):
+            try:
+                items = json.loads(value)
+            except ValueError:
+                pass
+
+    tags = []
+    for item in items:
+        tag = str(item).strip().lower()[:100]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def parse_sources(value):
+    """Decode a stored sources value (JSON list) into unique source names"""
+    if not value:
+        return []
+    try:
+        items = json.loads(value) if isinstance(value, str) else value
+    except ValueError:
+        items = value.split(",")
+
+    sources = []
+    for item in items:
+        source = str(item).strip()[:100]
+        if source and source not in sources:
+            sources.append(source)
+    return sources
+
+
+def sync_movie_labels(movie):
+    """Bring the movie's tag/source link rows in line with its text columns"""
+    tags = parse_tags(movie.tags)
+    current_tags = {link.tag for link in movie.tag_links}
+    movie.tag_links = [link for link in movie.tag_links if link.tag in tags] + [
+        MovieTag(tag=tag) for tag in tags if tag not in current_tags
+    ]
+
+    sources = parse_sources(movie.sources)
+    current_sources = {link.source for link in movie.source_links}
+    movie.source_links = [
+        link for link in movie.source_links if link.source in sources
+    ] + [
+        MovieSource(source=source)
+        for source in sources
+        if source not in current_sources
+    ]
+
+
+def rebuild_movie_labels(movie_ids=None, batch_size=1000):
+    """
+    Rebuild tag/source link rows with bulk statements (all movies if movie_ids is None)
+    Used after writes that bypass the ORM; the caller commits
+    """
+    if movie_ids is None:
+        movie_ids = [row.id for row in Movie.query.with_entities(Movie.id)]
+    movie_ids = list(movie_ids)
+
+    for start in range(0, len(movie_ids), batch_size):
+        chunk = movie_ids[start : start + batch_size]
+        rows = Movie.query.with_entities(Movie.id, Movie.tags, Movie.sources).filter(
+            Movie.id.in_(chunk)
+        )
+        tag_rows, source_rows = [], []
+        for row in rows:
+            tag_rows += [
+                {"movie_id": row.id, "tag": tag} for tag in parse_tags(row.tags)
+            ]
+            source_rows += [
+                {"movie_id": row.id, "source": source}
+                for source in parse_sources(row.sources)
+            ]
+
+        db.session.execute(
+            MovieTag.__table__.delete().where(MovieTag.movie_id.in_(chunk))
+        )
+        db.session.execute(
+            MovieSource.__table__.delete().where(MovieSource.movie_id.in_(chunk))
+        )
+        if tag_rows:
+            db.session.execute(MovieTag.__table__.insert(), tag_rows)
+        if source_rows:
+            db.session.execute(MovieSource.__table__.insert(), source_rows)
+
+
+def backfill_imdb_ratings():
+    """Recompute Movie.imdb_rating from imdb_score for every movie; the caller commits"""
+    rows = Movie.query.with_entities(Movie.id, Movie.imdb_score, Movie.imdb_rating)
+    updates = [
+        {"id": row.id, "imdb_rating": parse_imdb_rating(row.imdb_score)}
+        for row in rows
+        if parse_imdb_rating(row.imdb_score) != row.imdb_rating
+    ]
+    if updates:
+        db.session.execute(update(Movie), updates)
+
+
+@app.cli.command("reindex-movies")
+def reindex_movies_command():
+    """Rebuild derived movie data (tag/source links, imdb_rating) from the movie rows"""
+    rebuild_movie_labels()
+    backfill_imdb_ratings()
+    db.session.commit()
+    print(f"Reindexed {Movie.query.count()} movies")
+
+
+# Provider endpoints (overridable to point at a stub server, e.g. for load tests)
+TMDB_API_URL = os.getenv("TMDB_API_URL", "https://api.themoviedb.org/3")
+OMDB_API_URL = os.getenv("OMDB_API_URL", "http://www.omdbapi.com/")
+
+
+def provider_client(name, base_url):
+    """Provider client with deadlines, retries and circuit breaker from env"""
+    return ProviderClient(
+        name,
+        base_url,
+        timeout=float(os.getenv("PROVIDER_TIMEOUT", "5")),
+        deadline=float(os.getenv("PROVIDER_DEADLINE", "10")),
+        max_retries=int(os.getenv("PROVIDER_MAX_RETRIES", "2")),
+        backoff=float(os.getenv("PROVIDER_BACKOFF", "0.5")),
+        pool_size=int(os.getenv("PROVIDER_POOL_SIZE", "20")),
+        breaker=CircuitBreaker(
+            failure_threshold=int(os.getenv("PROVIDER_BREAKER_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("PROVIDER_BREAKER_RESET", "30")),
+        ),
+    )
+
+
+tmdb_client = provider_client("tmdb", TMDB_API_URL)
+omdb_client = provider_client("omdb", OMDB_API_URL)
+tmdb_client.observers.append(record_provider_call)
+omdb_client.observers.append(record_provider_call)
+
+
+PROVIDER_OUTAGE_MESSAGE = "Movie data providers are unavailable, try again later"
+
+
+def release_db_connection():
+    """
+    End the session's transaction so its connection goes back to the pool
+    Called before provider lookups, which can take seconds; loaded objects are
+    expired and reload on their next use
+    """
+    db.session.commit()
+
+
+def provider_outage():
+    """True while a provider's breaker is open and not yet due a trial call"""
+    return tmdb_client.breaker.is_open or omdb_client.breaker.is_open
+
+
 def search_movie_comprehensive(title):
     """
     Search for a movie using both TMDB and OMDB APIs to get comprehensive data
@@ -228,13 +917,10 @@ def search_movie_comprehensive(title):
         return search_movie_omdb_only(title, omdb_api_key)
 
     # Step 1: Search TMDB for the movie
-    tmdb_search_url = "https://api.themoviedb.org/3/search/movie"
     tmdb_params = {"api_key": tmdb_api_key, "query": title, "language": "en-US"}
 
     try:
-        tmdb_search_resp = requests.get(tmdb_search_url, params=tmdb_params)
-        tmdb_search_resp.raise_for_status()
-        tmdb_search_data = tmdb_search_resp.json()
+        tmdb_search_data = tmdb_client.get("/search/movie", params=tmdb_params)
 
         if not tmdb_search_data.get("results"):
             print(f"TMDB: No results found for '{title}'")
@@ -245,27 +931,15 @@ def search_movie_comprehensive(title):
         movie_id = tmdb_movie["id"]
 
         # Step 2: Get detailed movie information from TMDB
-        tmdb_details_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
-        tmdb_details_params = {
-            "api_key": tmdb_api_key,
-            "language": "en-US",
-            "append_to_response": "credits,videos,similar",
-        }
-
-        tmdb_details_resp = requests.get(tmdb_details_url, params=tmdb_details_params)
-        tmdb_details_resp.raise_for_status()
-        tmdb_details = tmdb_details_resp.json()
+        tmdb_details = fetch_tmdb_details(movie_id, tmdb_api_key)
 
         # Step 3: Try to get additional ratings from OMDB (for Rotten Tomatoes, etc.)
         omdb_data = None
         if omdb_api_key:
             try:
-                omdb_resp = requests.get(
-                    "http://www.omdbapi.com/",
-                    params={"t": tmdb_details["title"], "apikey": omdb_api_key},
+                omdb_result = omdb_client.get(
+                    "", params={"t": tmdb_details["title"], "apikey": omdb_api_key}
                 )
-                omdb_resp.raise_for_status()
-                omdb_result = omdb_resp.json()
                 if omdb_result.get("Response") == "True":
                     omdb_data = omdb_result
             except Exception as e:
@@ -279,17 +953,56 @@ def search_movie_comprehensive(title):
         return search_movie_omdb_only(title, omdb_api_key)
 
 
+def fetch_tmdb_details(movie_id, tmdb_api_key):
+    """Fetch TMDB movie details with credits, videos and similar movies"""
+    tmdb_details_params = {
+        "api_key": tmdb_api_key,
+        "language": "en-US",
+        "append_to_response": "credits,videos,similar",
+    }
+    return tmdb_client.get(f"/movie/{movie_id}", params=tmdb_details_params)
+
+
+def search_movie_by_tmdb_id(tmdb_id):
+    """
+    Fetch a movie with a known TMDB ID, adding OMDB ratings when available
+    Returns enriched movie data or None if not found
+    """
+    tmdb_api_key = os.getenv("TMDB_API_KEY")
+    omdb_api_key = os.getenv("OMDB_API_KEY")
+    if not tmdb_api_key:
+        return None
+
+    try:
+        tmdb_details = fetch_tmdb_details(tmdb_id, tmdb_api_key)
+    except Exception as e:
+        print(f"TMDB lookup by TMDB ID failed: {e}")
+        return None
+
+    omdb_data = None
+    if omdb_api_key:
+        # Prefer the IMDB ID TMDB reports over a title match
+        if tmdb_details.get("imdb_id"):
+            omdb_params = {"i": tmdb_details["imdb_id"], "apikey": omdb_api_key}
+        else:
+            omdb_params = {"t": tmdb_details.get("title"), "apikey": omdb_api_key}
+        try:
+            omdb_result = omdb_client.get("", params=omdb_params)
+            if omdb_result.get("Response") == "True":
+                omdb_data = omdb_result
+        except Exception as e:
+            print(f"OMDB lookup failed: {e}")
+
+    return combine_movie_data(tmdb_details, omdb_data)
+
+
 def search_movie_omdb_only(title, omdb_api_key):
     """Fallback to OMDB-only search"""
     if not omdb_api_key:
         return None
 
     try:
-        resp = requests.get(
-            "http://www.omdbapi.com/", params={"t": title, "apikey": omdb_api_key}
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = omdb_client.get("", params={"t": title, "apikey": omdb_api_key})
 
         if data.get("Response") != "True":
             return None
@@ -311,6 +1024,7 @@ def search_movie_omdb_only(title, omdb_api_key):
                 data.get("Ratings", []), "Rotten Tomatoes"
             ),
             "metacritic_score": extract_rating(data.get("Ratings", []), "Metacritic"),
+            "imdb_id": data.get("imdbID"),
             "tmdb_id": None,
             "backdrop_url": None,
             "trailers": [],
@@ -409,6 +1123,7 @@ def combine_movie_data(tmdb_data, omdb_data):
         "rotten_tomatoes_score": None,  # Will be filled from OMDB if available
         "metacritic_score": None,  # Will be filled from OMDB if available
         "tmdb_id": tmdb_data.get("id"),
+        "imdb_id": tmdb_data.get("imdb_id"),
         "tmdb_rating": tmdb_data.get("vote_average"),
         "tmdb_vote_count": tmdb_data.get("vote_count"),
         "trailers": trailers,
@@ -429,6 +1144,8 @@ def combine_movie_data(tmdb_data, omdb_data):
         combined_data["metacritic_score"] = extract_rating(
             omdb_data.get("Ratings", []), "Metacritic"
         )
+        if not combined_data["imdb_id"]:
+            combined_data["imdb_id"] = omdb_data.get("imdbID")
 
         # Use OMDB runtime if TMDB doesn't have it
         if not combined_data["runtime"] and omdb_data.get("Runtime") != "N/A":
@@ -462,11 +1179,9 @@ def search_movie_by_imdb_id(imdb_id):
     omdb_data = None
     if omdb_api_key:
         try:
-            omdb_resp = requests.get(
-                "http://www.omdbapi.com/", params={"i": imdb_id, "apikey": omdb_api_key}
+            omdb_result = omdb_client.get(
+                "", params={"i": imdb_id, "apikey": omdb_api_key}
             )
-            omdb_resp.raise_for_status()
-            omdb_result = omdb_resp.json()
             if omdb_result.get("Response") == "True":
                 omdb_data = omdb_result
         except Exception as e:
@@ -477,12 +1192,10 @@ def search_movie_by_imdb_id(imdb_id):
     if tmdb_api_key:
         try:
             # TMDB find endpoint can find movies by IMDB ID
-            tmdb_find_url = f"https://api.themoviedb.org/3/find/{imdb_id}"
             tmdb_find_params = {"api_key": tmdb_api_key, "external_source": "imdb_id"}
-
-            tmdb_find_resp = requests.get(tmdb_find_url, params=tmdb_find_params)
-            tmdb_find_resp.raise_for_status()
-            tmdb_find_data = tmdb_find_resp.json()
+            tmdb_find_data = tmdb_client.get(
+                f"/find/{imdb_id}", params=tmdb_find_params
+            )
 
             # Check if we found movie results
             if tmdb_find_data.get("movie_results"):
@@ -490,18 +1203,7 @@ def search_movie_by_imdb_id(imdb_id):
                 movie_id = movie_result["id"]
 
                 # Get detailed movie information from TMDB
-                tmdb_details_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
-                tmdb_details_params = {
-                    "api_key": tmdb_api_key,
-                    "language": "en-US",
-                    "append_to_response": "credits,videos,similar",
-                }
-
-                tmdb_details_resp = requests.get(
-                    tmdb_details_url, params=tmdb_details_params
-                )
-                tmdb_details_resp.raise_for_status()
-                tmdb_data = tmdb_details_resp.json()
+                tmdb_data = fetch_tmdb_details(movie_id, tmdb_api_key)
 
         except Exception as e:
             print(f"TMDB lookup by IMDB ID failed: {e}")
@@ -548,6 +1250,48 @@ def search_movie_by_imdb_id(imdb_id):
     return None
 
 
+@app.route("/health/providers", methods=["GET"])
+def provider_health():
+    """Circuit breaker state and call counters per provider, for monitoring"""
+    status = {"tmdb": tmdb_client.status(), "omdb": omdb_client.status()}
+    return jsonify(status), 503 if provider_outage() else 200
+
+
+@app.route("/admin/profiles", methods=["GET"])
+@role_required("admin")
+def list_profiles():
+    """Most recent request profiles, newest first"""
+    summaries = []
+    for path in profile_store.list()[:50]:
+        profile = profile_store.load(os.path.basename(path)[: -len(".json")])
+        if profile:
+            summaries.append(
+                {
+                    "id": profile["id"],
+                    "method": profile["method"],
+                    "path": profile["path"],
+                    "status": profile["status"],
+                    "started_at": profile["started_at"],
+                    "duration_ms": profile["duration_ms"],
+                    "sql_ms": profile["sql"]["total_ms"],
+                    "calls_ms": profile["calls"]["total_ms"],
+                }
+            )
+    return jsonify(summaries)
+
+
+@app.route("/admin/profiles/<profile_id>", methods=["GET"])
+@role_required("admin")
+def get_profile(profile_id):
+    """A stored profile as JSON, or its stack samples with format=folded"""
+    profile = profile_store.load(profile_id)
+    if profile is None:
+        return jsonify({"error": "Profile not found"}), 404
+    if request.args.get("format") == "folded":
+        return Response(folded_stacks(profile["samples"]), mimetype="text/plain")
+    return jsonify(profile)
+
+
 # Authentication routes
 @app.route("/auth/register", methods=["POST", "OPTIONS"])
 def register():
@@ -643,11 +1387,15 @@ def check_auth():
 # Movie routes (now with authentication)
 @app.route("/movies", methods=["GET", "POST"])
 @auth_required
+@read_replica
+@cached_response
 def movies():
     if request.method == "GET":
         # Both users and admins can view movies
-        movies = Movie.query.all()
-        return jsonify([m.to_dict() for m in movies])
+        query, error = sort_movie_query(Movie.query, request.args)
+        if error:
+            return jsonify({"error": error}), 400
+        return jsonify([m.to_dict() for m in query.all()])
     if request.method == "POST":
         # Only admins can manually add movies
         if not current_user.has_role("admin"):
@@ -657,6 +1405,7 @@ def movies():
         if "sources" in data and isinstance(data["sources"], list):
             data["sources"] = json.dumps(data["sources"])
         movie = Movie(**data)
+        sync_movie_labels(movie)
         db.session.add(movie)
         db.session.commit()
         return jsonify(movie.to_dict()), 201
@@ -664,6 +1413,8 @@ def movies():
 
 @app.route("/movies/<int:movie_id>", methods=["GET", "PUT", "DELETE"])
 @auth_required
+@read_replica
+@cached_response
 def movie_detail(movie_id):
     movie = Movie.query.get_or_404(movie_id)
     if request.method == "GET":
@@ -678,6 +1429,7 @@ def movie_detail(movie_id):
             if key == "sources" and isinstance(value, list):
                 value = json.dumps(value)
             setattr(movie, key, value)
+        sync_movie_labels(movie)
         db.session.commit()
         return jsonify(movie.to_dict())
     if request.method == "DELETE":
@@ -689,6 +1441,168 @@ def movie_detail(movie_id):
         return jsonify({"message": "deleted"})
 
 
+# Upper bound on the number of rows a single batch request may touch
+BATCH_MAX_ROWS = int(os.getenv("BATCH_MAX_ROWS", "1000"))
+
+
+def parse_datetime(value):
+    """Parse an ISO 8601 timestamp (as sent by the frontend) into a naive UTC datetime"""
+    if value is None or isinstance(value, datetime):
+        return value
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def normalize_movie_patch(data):
+    """
+    Validate a partial movie update and convert it to column values
+    Returns (values, error) where error is a message for a 400 response
+    """
+    if not isinstance(data, dict) or not data:
+        return None, "patch must be a non-empty object"
+
+    columns = {column.name: column for column in Movie.__table__.columns}
+    values = {}
+    for key, value in data.items():
+        if key in ("id", "imdb_rating") or key not in columns:
+            return None, f"Unknown or read-only field: {key}"
+        column_type = columns[key].type
+        if value is None:
+            if not columns[key].nullable:
+                return None, f"Field is required: {key}"
+        # Label lists are stored the way coerce_import_row stores them
+        elif key in ("sources", "tags") and isinstance(value, list):
+            if not all(isinstance(item, str) for item in value):
+                return None, f"Invalid list for field: {key}"
+            value = json.dumps(value) if key == "sources" else ", ".join(value)
+        elif isinstance(column_type, db.DateTime):
+            try:
+                value = parse_datetime(value)
+            except (AttributeError, TypeError, ValueError):
+                return None, f"Invalid datetime for field: {key}"
+        elif isinstance(column_type, db.Boolean):
+            if not isinstance(value, bool):
+                return None, f"Invalid boolean for field: {key}"
+        elif isinstance(column_type, (db.Integer, db.Float)):
+            # bool is an int subclass, but true is not a rating or an ID
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None, f"Invalid number for field: {key}"
+            if isinstance(column_type, db.Integer):
+                if isinstance(value, float) and not value.is_integer():
+                    return None, f"Invalid integer for field: {key}"
+                value = int(value)
+            else:
+                value = float(value)
+        elif not isinstance(value, str):
+            return None, f"Invalid text for field: {key}"
+        elif column_type.length and len(value) > column_type.length:
+            return None, f"Too long for field: {key} (max {column_type.length})"
+        values[key] = value
+    # Bulk updates bypass the ORM validator that derives imdb_rating
+    if "imdb_score" in values:
+        values["imdb_rating"] = parse_imdb_rating(values["imdb_score"])
+    return values, None
+
+
+@app.route("/movies/batch", methods=["PATCH"])
+@role_required("admin")
+def batch_update_movies():
+    """
+    Apply partial updates to many movies in a single transaction
+
+    Accepts either per-id patches:
+        {"updates": [{"id": 1, "watched": true}, {"id": 2, "lent_to": "Sam"}]}
+    or one patch applied to a selection given by ids or /movies/filter arguments:
+        {"ids": [1, 2, 3], "patch": {"watched": true}}
+        {"filter": {"director": "Nolan"}, "patch": {"tags": "favorite"}}
+    Rows sharing the same patch are written with one UPDATE ... WHERE id IN (...)
+    """
+    data = request.json
+    if not isinstance(data, dict):
+        return jsonify({"error": "JSON body required"}), 400
+
+    # Collect the effective patch per movie id (later entries win)
+    patches = {}
+    if "updates" in data:
+        if not isinstance(data["updates"], list):
+            return jsonify({"error": "updates must be a list"}), 400
+        for item in data["updates"]:
+            if not isinstance(item, dict) or not isinstance(item.get("id"), int):
+                return jsonify({"error": "each update needs an integer id"}), 400
+            values, error = normalize_movie_patch(
+                {key: value for key, value in item.items() if key != "id"}
+            )
+            if error:
+                return jsonify({"error": error, "id": item["id"]}), 400
+            patches.setdefault(item["id"], {}).update(values)
+    elif "patch" in data:
+        values, error = normalize_movie_patch(data["patch"])
+        if error:
+            return jsonify({"error": error}), 400
+        if "ids" in data:
+            ids = data["ids"]
+            if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+                return jsonify({"error": "ids must be a list of integers"}), 400
+        elif isinstance(data.get("filter"), dict):
+            ids = [
+                row.id
+                for row in filter_movie_query(data["filter"]).with_entities(Movie.id)
+            ]
+        else:
+            return jsonify({"error": "patch requires ids or filter"}), 400
+        patches = {movie_id: values for movie_id in ids}
+    else:
+        return jsonify({"error": "updates or patch required"}), 400
+
+    if len(patches) > BATCH_MAX_ROWS:
+        return jsonify(
+            {"error": f"Batch too large, at most {BATCH_MAX_ROWS} movies per request"}
+        ), 400
+
+    existing = {
+        row.id
+        for row in Movie.query.with_entities(Movie.id).filter(
+            Movie.id.in_(list(patches))
+        )
+    }
+
+    # Group ids by identical patch so each distinct patch is a single UPDATE
+    groups = {}
+    for movie_id, values in patches.items():
+        if movie_id in existing:
+            key = json.dumps(values, sort_keys=True, default=str)
+            groups.setdefault(key, (values, []))[1].append(movie_id)
+
+    relabel_ids = []
+    for values, ids in groups.values():
+        db.session.execute(
+            update(Movie)
+            .where(Movie.id.in_(ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if "tags" in values or "sources" in values:
+            relabel_ids += ids
+    if relabel_ids:
+        rebuild_movie_labels(relabel_ids)
+    db.session.commit()
+
+    return jsonify(
+        {
+            "updated": len(existing),
+            "results": [
+                {
+                    "id": movie_id,
+                    "status": "updated" if movie_id in existing else "not_found",
+                }
+                for movie_id in patches
+            ],
+        }
+    )
+
+
 @app.route("/movies/search", methods=["GET"])
 @role_required("admin")
 def search_movie():
@@ -710,8 +1624,11 @@ def search_movie():
         ), 409
 
     # Search using both TMDB and OMDB for comprehensive data
+    release_db_connection()
     movie_data = search_movie_comprehensive(title)
     if not movie_data:
+        if provider_outage():
+            return jsonify({"error": PROVIDER_OUTAGE_MESSAGE}), 503
         return jsonify({"error": "movie not found"}), 404
     # Create movie from comprehensive data
     movie = Movie(
@@ -729,13 +1646,16 @@ def search_movie():
         sources=json.dumps(movie_sources) if movie_sources else None,
         # Store TMDB data directly in database
         tmdb_id=movie_data.get("tmdb_id"),
+        imdb_id=movie_data.get("imdb_id"),
         backdrop_url=movie_data.get("backdrop_url"),
         tmdb_rating=movie_data.get("tmdb_rating"),
         tmdb_vote_count=movie_data.get("tmdb_vote_count"),
         cast_data=json.dumps(movie_data.get("cast", [])),
         trailers_data=json.dumps(movie_data.get("trailers", [])),
         similar_movies_data=json.dumps(movie_data.get("similar_movies", [])),
+        last_enriched_at=datetime.utcnow(),
     )
+    sync_movie_labels(movie)
     db.session.add(movie)
     db.session.commit()
 
@@ -743,6 +1663,59 @@ def search_movie():
     return jsonify(movie.to_dict()), 201
 
 
+# Columns filled in when a stored movie is enhanced with TMDB data
+ENHANCED_FIELDS = [
+    "tmdb_id",
+    "imdb_id",
+    "backdrop_url",
+    "tmdb_rating",
+    "tmdb_vote_count",
+    "cast_data",
+    "trailers_data",
+    "similar_movies_data",
+]
+ENHANCE_MAX_IDS = int(os.getenv("ENHANCE_MAX_IDS", "100"))  # IDs per batch request
+ENHANCE_WORKERS = int(os.getenv("ENHANCE_WORKERS", "4"))  # Concurrent lookups
+
+
+def enhance_movie(movie, movie_data):
+    """Store TMDB data on a movie, keeping an IMDB ID it already has"""
+    fields = [f for f in ENHANCED_FIELDS if f != "imdb_id" or not movie.imdb_id]
+    apply_movie_data(movie, movie_data, fields)
+    movie.last_enriched_at = datetime.utcnow()
+
+
+def iter_enhanced_movies(movies):
+    """
+    Yield (movie, enhanced) as details become available
+    Movies with stored TMDB data come first; the rest are looked up concurrently on
+    a bounded pool and yielded as each lookup completes. Only the provider calls
+    run on the pool, database writes stay on the calling thread
+    """
+    missing = [movie for movie in movies if movie.tmdb_id is None]
+    yield from ((movie, False) for movie in movies if movie.tmdb_id is not None)
+    if not missing or provider_outage():
+        yield from ((movie, False) for movie in missing)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(ENHANCE_WORKERS, len(missing))) as pool:
+        lookups = {
+            pool.submit(propagate(search_movie_comprehensive), movie.title): movie
+            for movie in missing
+        }
+        release_db_connection()
+        for future in as_completed(lookups):
+            movie = lookups[future]
+            try:
+                movie_data = future.result()
+            except Exception as e:
+                print(f"Enhancing movie {movie.id} failed: {e}")
+                movie_data = None
+            if movie_data:
+                enhance_movie(movie, movie_data)
+            yield movie, bool(movie_data)
+
+
 @app.route("/movies/<int:movie_id>/enhanced", methods=["GET"])
 @auth_required
 def get_enhanced_movie_details(movie_id):
@@ -752,22 +1725,82 @@ def get_enhanced_movie_details(movie_id):
     # Check if TMDB data is already stored
     if movie.tmdb_id is None:
         # TMDB data not stored yet, fetch and save it
-        movie_data = search_movie_comprehensive(movie.title)
+        title = movie.title
+        release_db_connection()
+        movie_data = search_movie_comprehensive(title)
         if movie_data:
-            # Update the movie with TMDB data
-            movie.tmdb_id = movie_data.get("tmdb_id")
-            movie.backdrop_url = movie_data.get("backdrop_url")
-            movie.tmdb_rating = movie_data.get("tmdb_rating")
-            movie.tmdb_vote_count = movie_data.get("tmdb_vote_count")
-            movie.cast_data = json.dumps(movie_data.get("cast", []))
-            movie.trailers_data = json.dumps(movie_data.get("trailers", []))
-            movie.similar_movies_data = json.dumps(movie_data.get("similar_movies", []))
+            enhance_movie(movie, movie_data)
             db.session.commit()
 
     # Return movie data (now including stored TMDB data)
     return jsonify(movie.to_dict())
 
 
+@app.route("/movies/enhanced", methods=["GET"])
+@auth_required
+def get_enhanced_movies():
+    """
+    Enhanced details for several movies: /movies/enhanced?ids=1,2,3
+    Returns {"movies": [...], "missing": [ids]} in request order, or with
+    stream=1 one NDJSON line per movie as soon as it is ready. lookup=0 returns
+    stored data only, without provider lookups
+    """
+    try:
+        ids = list(dict.fromkeys(int(value) for value in arg_list(request.args, "ids")))
+    except ValueError:
+        return jsonify({"error": "ids must be integers"}), 400
+    if not ids:
+        return jsonify({"error": "ids query param required"}), 400
+    if len(ids) > ENHANCE_MAX_IDS:
+        return jsonify({"error": f"at most {ENHANCE_MAX_IDS} ids per request"}), 400
+
+    lookup = request.args.get("lookup", "1").lower() not in ("0", "false", "no")
+
+    def load_movies():
+        # Commits below only write the enhanced movies, keep every loaded row
+        # readable without a reload per movie
+        db.session().expire_on_commit = False
+        movies = Movie.query.filter(Movie.id.in_(ids)).all()
+        found = {movie.id for movie in movies}
+        missing = [movie_id for movie_id in ids if movie_id not in found]
+        if lookup:
+            return iter_enhanced_movies(movies), missing
+        return ((movie, False) for movie in movies), missing
+
+    if request.args.get("stream", "").lower() in ("1", "true", "yes"):
+
+        def generate():
+            # Load inside the stream, the request's own session is gone by now
+            movies, missing = load_movies()
+            for movie_id in missing:
+                yield json.dumps({"id": movie_id, "error": "Movie not found"}) + "\n"
+            for movie, enhanced in movies:
+                if enhanced:
+                    # Commit before sending it so streamed data is stored
+                    db.session.commit()
+                yield json.dumps(movie.to_dict()) + "\n"
+
+        return Response(
+            stream_with_context(generate()), mimetype="application/x-ndjson"
+        )
+
+    movies, missing = load_movies()
+    ready, enhanced_any = {}, False
+    for movie, enhanced in movies:
+        ready[movie.id] = movie
+        enhanced_any = enhanced_any or enhanced
+    if enhanced_any:
+        db.session.commit()
+    return jsonify(
+        {
+            "movies": [
+                ready[movie_id].to_dict() for movie_id in ids if movie_id in ready
+            ],
+            "missing": missing,
+        }
+    )
+
+
 @app.route("/movies/search/imdb", methods=["GET"])
 @role_required("admin")
 def search_movie_by_imdb():
@@ -781,15 +1814,21 @@ def search_movie_by_imdb():
 
     # Clean IMDB ID and check if movie already exists by IMDB ID
     clean_imdb_id = imdb_id if imdb_id.startswith("tt") else f"tt{imdb_id}"
-    existing_movie = Movie.query.filter(Movie.plot.contains(clean_imdb_id)).first()
-    if not existing_movie:
-        # Also check if we have this IMDB ID in our database (we'll need to add an imdb_id field later)
-        # For now, we'll check by exact title match after fetching
-        pass
+    existing_movie = Movie.query.filter_by(imdb_id=clean_imdb_id).first()
+    if existing_movie:
+        return jsonify(
+            {
+                "error": "Movie already exists in your collection",
+                "movie": existing_movie.to_dict(),
+            }
+        ), 409
 
     # Search using IMDB ID
+    release_db_connection()
     movie_data = search_movie_by_imdb_id(imdb_id)
     if not movie_data:
+        if provider_outage():
+            return jsonify({"error": PROVIDER_OUTAGE_MESSAGE}), 503
         return jsonify({"error": "Movie not found"}), 404
 
     # Check if movie already exists by title to prevent duplicates
@@ -818,13 +1857,16 @@ def search_movie_by_imdb():
         sources=json.dumps(movie_sources) if movie_sources else None,
         # Store TMDB data directly in database
         tmdb_id=movie_data.get("tmdb_id"),
+        imdb_id=movie_data.get("imdb_id"),
         backdrop_url=movie_data.get("backdrop_url"),
         tmdb_rating=movie_data.get("tmdb_rating"),
         tmdb_vote_count=movie_data.get("tmdb_vote_count"),
         cast_data=json.dumps(movie_data.get("cast", [])),
         trailers_data=json.dumps(movie_data.get("trailers", [])),
         similar_movies_data=json.dumps(movie_data.get("similar_movies", [])),
+        last_enriched_at=datetime.utcnow(),
     )
+    sync_movie_labels(movie)
     db.session.add(movie)
     db.session.commit()
 
@@ -832,74 +1874,211 @@ def search_movie_by_imdb():
     return jsonify(movie.to_dict()), 201
 
 
-@app.route("/movies/filter", methods=["GET"])
-@auth_required
-def filter_movies():
+def arg_list(args, key):
+    """Read a repeatable, comma separated query argument from request args or a dict"""
+    if hasattr(args, "getlist"):
+        raw = args.getlist(key)
+    else:
+        raw = args.get(key) or []
+        raw = raw if isinstance(raw, list) else [raw]
+    return [
+        item.strip() for value in raw for item in str(value).split(",") if item.strip()
+    ]
+
+
+def label_filter(link_model, column, values, mode):
+    """Movie.id predicate for link-table values with any/all semantics"""
+    matches = db.session.query(link_model.movie_id).filter(column.in_(values))
+    if mode == "all":
+        matches = matches.group_by(link_model.movie_id).having(
+            db.func.count() == len(values)
+        )
+    return Movie.id.in_(matches)
+
+
+# Columns accepted by ?sort= (imdb_score sorts by its numeric copy)
+SORT_COLUMNS = {
+    "date_added": Movie.date_added,
+    "year": Movie.year,
+    "title": Movie.title,
+    "personal_rating": Movie.personal_rating,
+    "imdb_rating": Movie.imdb_rating,
+    "imdb_score": Movie.imdb_rating,
+    "tmdb_rating": Movie.tmdb_rating,
+}
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+MAX_TOP_N = 100
+
+
+def sort_movie_query(query, args):
+    """
+    Apply ?sort=, ?order=, ?limit= and ?offset= to a Movie query
+    Returns (query, error) where error is a message for a 400 response
+    """
+    sort = args.get("sort")
+    try:
+        limit = int(args["limit"]) if args.get("limit") else None
+        offset = int(args.get("offset") or 0)
+    except ValueError:
+        return None, "limit and offset must be integers"
+    if (limit is not None and limit < 0) or offset < 0:
+        return None, "limit and offset must not be negative"
+
+    if sort:
+        if sort not in SORT_COLUMNS:
+            return None, f"sort must be one of {list(SORT_COLUMNS)}"
+        # Titles read naturally A-Z, everything else newest/highest first
+        order = args.get("order") or ("asc" if sort == "title" else "desc")
+        if order not in ("asc", "desc"):
+            return None, "order must be asc or desc"
+        column = SORT_COLUMNS[sort]
+        if order == "asc":
+            query = query.order_by(column.asc().nulls_last(), Movie.id)
+        else:
+            query = query.order_by(column.desc().nulls_last(), Movie.id.desc())
+    elif limit is not None or offset:
+        # Pages need a stable order
+        query = query.order_by(Movie.id)
+
+    if limit is not None:
+        query = query.limit(min(limit, MAX_PAGE_SIZE))
+    if offset:
+        query = query.offset(offset)
+    return query, None
+
+
+def filter_movie_query(args):
+    """Build a Movie query from /movies/filter style query arguments"""
     query = Movie.query
 
     # Filter by genre
-    genre = request.args.get("genre")
+    genre = args.get("genre")
     if genre:
         query = query.filter(Movie.genre.ilike(f"%{genre}%"))
 
     # Filter by year
-    year = request.args.get("year")
+    year = args.get("year")
     if year:
         query = query.filter(Movie.year == year)
 
     # Filter by director
-    director = request.args.get("director")
+    director = args.get("director")
     if director:
         query = query.filter(Movie.director.ilike(f"%{director}%"))
 
     # Filter by actor
-    actor = request.args.get("actor")
+    actor = args.get("actor")
     if actor:
         query = query.filter(Movie.actors.ilike(f"%{actor}%"))
 
     # Search by title
-    title = request.args.get("title")
+    title = args.get("title")
     if title:
         query = query.filter(Movie.title.ilike(f"%{title}%"))
 
     # Minimum rating filter
-    min_rating = request.args.get("min_rating")
+    min_rating = args.get("min_rating")
     if min_rating:
         try:
             min_rating = float(min_rating)
-            query = query.filter(Movie.imdb_score.cast(db.Float) >= min_rating)
+            query = query.filter(Movie.imdb_rating >= min_rating)
         except ValueError:
             pass
 
-    movies = query.all()
+    # Filter by tags / sources via the indexed link tables (tag_mode=any|all)
+    tags = list(dict.fromkeys(tag.lower() for tag in arg_list(args, "tag")))
+    if tags:
+        query = query.filter(
+            label_filter(MovieTag, MovieTag.tag, tags, args.get("tag_mode"))
+        )
+    sources = list(dict.fromkeys(arg_list(args, "source")))
+    if sources:
+        query = query.filter(
+            label_filter(
+                MovieSource, MovieSource.source, sources, args.get("source_mode")
+            )
+        )
+
+    return query
+
+
+@app.route("/movies/filter", methods=["GET"])
+@auth_required
+@read_replica
+@cached_response
+def filter_movies():
+    query, error = sort_movie_query(filter_movie_query(request.args), request.args)
+    if error:
+        return jsonify({"error": error}), 400
+    return jsonify([movie.to_dict() for movie in query.all()])
+
+
+@app.route("/movies/top", methods=["GET"])
+@auth_required
+@read_replica
+@cached_response
+def top_movies():
+    """Top-N movies by one sortable column, e.g. ?by=date_added for latest added"""
+    by = request.args.get("by", "imdb_rating")
+    if by not in SORT_COLUMNS:
+        return jsonify({"error": f"by must be one of {list(SORT_COLUMNS)}"}), 400
+    try:
+        limit = max(1, min(int(request.args.get("limit", 10)), MAX_TOP_N))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    # Matches the (column DESC NULLS LAST, id DESC) index, so this is a LIMIT-k scan
+    column = SORT_COLUMNS[by]
+    movies = (
+        Movie.query.filter(column.isnot(None))
+        .order_by(column.desc().nulls_last(), Movie.id.desc())
+        .limit(limit)
+        .all()
+    )
     return jsonify([movie.to_dict() for movie in movies])
 
 
+@app.route("/movies/tags", methods=["GET"])
+@auth_required
+@read_replica
+@cached_response
+def movie_tag_counts():
+    """Per-tag and per-source movie counts, optionally narrowed by /movies/filter args"""
+    tags = db.session.query(MovieTag.tag, db.func.count()).group_by(MovieTag.tag)
+    sources = db.session.query(MovieSource.source, db.func.count()).group_by(
+        MovieSource.source
+    )
+    if request.args:
+        movie_ids = filter_movie_query(request.args).with_entities(Movie.id)
+        tags = tags.filter(MovieTag.movie_id.in_(movie_ids))
+        sources = sources.filter(MovieSource.movie_id.in_(movie_ids))
+
+    return jsonify(
+        {
+            "tags": dict(sorted(tags.all(), key=lambda x: x[1], reverse=True)),
+            "sources": dict(sorted(sources.all(), key=lambda x: x[1], reverse=True)),
+        }
+    )
+
+
 @app.route("/movies/stats", methods=["GET"])
 @auth_required
+@read_replica
+@cached_response
 def movie_stats():
-    total_movies = Movie.query.count()
-
-    # Genre distribution
-    genres = {}
-    for movie in Movie.query.all():
-        if movie.genre:
-            for genre in movie.genre.split(", "):
-                genre = genre.strip()
-                genres[genre] = genres.get(genre, 0) + 1
-
-    # Year distribution
-    years = {}
-    for movie in Movie.query.all():
-        if movie.year:
-            decade = f"{movie.year[:3]}0s"
-            years[decade] = years.get(decade, 0) + 1
-
-    # Top directors
-    directors = {}
-    for movie in Movie.query.all():
-        if movie.director:
-            directors[movie.director] = directors.get(movie.director, 0) + 1
+    total_movies = 0
+    genres, years, directors = {}, {}, {}
+    rows = db.session.execute(db.select(Movie.genre, Movie.year, Movie.director))
+    for row in rows:
+        total_movies += 1
+        counts = movie_stats_counts(row.genre, row.year, row.director)
+        for target, values in (
+            (genres, counts["genres"]),
+            (years, counts["decades"]),
+            (directors, counts["top_directors"]),
+        ):
+            for key, count in values.items():
+                target[key] = target.get(key, 0) + count
 
     return jsonify(
         {
@@ -915,6 +2094,782 @@ def movie_stats():
     )
 
 
+# Server-sent change events
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+# Streams are closed after this long, the browser reconnects by itself
+SSE_MAX_SECONDS = float(os.getenv("SSE_MAX_SECONDS", "300"))
+
+
+def sse_message(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@app.route("/movies/events", methods=["GET"])
+@auth_required
+def movie_events():
+    """
+    Stream collection changes as server-sent events
+    "hello" carries the current generation; each "change" carries one committed
+    transaction (see collection_change_message)
+    """
+    if db.engine.dialect.name == "postgresql":
+        pg_listener.ensure_started(
+            db.engine.url.set(drivername="postgresql").render_as_string(
+                hide_password=False
+            )
+        )
+    subscriber = event_broker.subscribe()
+    # Read after subscribing so no change falls between the two
+    generation = (
+        db.session.execute(
+            db.select(CollectionState.generation).where(CollectionState.id == 1)
+        ).scalar()
+        or 0
+    )
+
+    def stream():
+        try:
+            yield "retry: 3000\n\n"
+            yield sse_message("hello", {"generation": generation})
+            deadline = time.monotonic() + SSE_MAX_SECONDS
+            while time.monotonic() < deadline and not subscriber.overflowed:
+                try:
+                    message = subscriber.queue.get(timeout=SSE_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield sse_message("change", message)
+        finally:
+            event_broker.unsubscribe(subscriber)
+
+    # No stream_with_context: the stream never touches the database
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Typeahead suggestions from an in-process prefix index
+SUGGEST_MAX_LIMIT = 50
+SUGGEST_FIELDS = (
+    "title",
+    "director",
+    "actors",
+    "imdb_rating",
+    "tmdb_rating",
+    "tmdb_vote_count",
+)
+
+suggest_index = SuggestIndex()
+
+
+def suggest_row(movie):
+    """The movie fields the typeahead index needs"""
+    return {
+        "id": movie.id,
+        "title": movie.title,
+        "director": movie.director,
+        "actors": movie.actors,
+        "rating": movie.imdb_rating or movie.tmdb_rating,
+        "votes": movie.tmdb_vote_count,
+    }
+
+
+def build_suggest_index(generation):
+    """(Re)build the typeahead index from the movie table as of generation"""
+    rows = db.session.execute(
+        db.select(
+            Movie.id,
+            Movie.title,
+            Movie.director,
+            Movie.actors,
+            Movie.imdb_rating,
+            Movie.tmdb_rating,
+            Movie.tmdb_vote_count,
+        )
+    )
+    suggest_index.rebuild((suggest_row(row) for row in rows), generation)
+
+
+suggest_rebuild_lock = threading.Lock()
+
+
+def rebuild_suggest_index_in_background():
+    """Rebuild the typeahead index off the request thread, one rebuild at a time"""
+    if not suggest_rebuild_lock.acquire(blocking=False):
+        return
+
+    def rebuild():
+        try:
+            with app.app_context():
+                build_suggest_index(collection_generation())
+        except Exception as e:
+            print(f"Typeahead index rebuild failed: {e}")
+        finally:
+            suggest_rebuild_lock.release()
+
+    threading.Thread(target=rebuild, daemon=True).start()
+
+
+@app.route("/movies/suggest", methods=["GET"])
+@auth_required
+@read_replica
+def suggest_movies():
+    """Typeahead over titles, directors and actors: /movies/suggest?q=nol"""
+    query = request.args.get("q", "")
+    by = request.args.get("by", "rating")
+    if by not in RANKINGS:
+        return jsonify({"error": f"by must be one of {list(RANKINGS)}"}), 400
+    kinds = arg_list(request.args, "type") or SUGGEST_KINDS
+    if any(kind not in SUGGEST_KINDS for kind in kinds):
+        return jsonify({"error": f"type must be one of {list(SUGGEST_KINDS)}"}), 400
+    try:
+        limit = min(int(request.args.get("limit", 10)), SUGGEST_MAX_LIMIT)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    # Other workers and the refresh job change movies too, the generation says when.
+    # Until the rebuild lands, keystrokes are answered from the index as it was
+    generation = collection_generation()
+    if not suggest_index.ready:
+        build_suggest_index(generation)
+    elif not suggest_index.is_current(generation):
+        rebuild_suggest_index_in_background()
+    return jsonify(suggest_index.suggest(query, limit=limit, by=by, kinds=kinds))
+
+
+# Incremental refresh of provider data
+REFRESH_LIMIT = int(os.getenv("REFRESH_LIMIT", "50"))  # Movies per run
+REFRESH_BATCH_SIZE = int(os.getenv("REFRESH_BATCH_SIZE", "10"))  # Movies per commit
+REFRESH_MAX_AGE_HOURS = float(os.getenv("REFRESH_MAX_AGE_HOURS", "168"))
+REFRESH_TMDB_QUOTA = int(os.getenv("REFRESH_TMDB_QUOTA", "200"))  # Calls per run
+REFRESH_OMDB_QUOTA = int(os.getenv("REFRESH_OMDB_QUOTA", "100"))  # Calls per run
+
+# Provider-owned columns a refresh may overwrite (user edits elsewhere are kept)
+REFRESH_FIELDS = [
+    "imdb_score",
+    "rotten_tomatoes_score",
+    "metacritic_score",
+    "tmdb_id",
+    "imdb_id",
+    "tmdb_rating",
+    "tmdb_vote_count",
+    "poster_url",
+    "backdrop_url",
+    "cast_data",
+    "trailers_data",
+    "similar_movies_data",
+]
+# A title search may find a different movie of the same name, so a movie found
+# that way only gets ratings, never its IDs, artwork or credits
+TITLE_MATCH_REFRESH_FIELDS = [
+    "imdb_score",
+    "rotten_tomatoes_score",
+    "metacritic_score",
+    "tmdb_rating",
+    "tmdb_vote_count",
+]
+
+# Column name -> key in the dicts returned by the search_movie_* helpers
+MOVIE_DATA_KEYS = {
+    "cast_data": "cast",
+    "trailers_data": "trailers",
+    "similar_movies_data": "similar_movies",
+}
+
+
+def apply_movie_data(movie, movie_data, fields=REFRESH_FIELDS):
+    """
+    Copy provider data onto a movie, touching only columns whose value changed
+    Missing or empty provider values never overwrite stored data
+    Returns the list of changed column names
+    """
+    changed = []
+    for field in fields:
+        value = movie_data.get(MOVIE_DATA_KEYS.get(field, field))
+        if value is None or value == []:
+            continue
+        if field in MOVIE_DATA_KEYS:
+            value = json.dumps(value)
+        if getattr(movie, field) != value:
+            setattr(movie, field, value)
+            changed.append(field)
+    return changed
+
+
+def refresh_lookup(movie):
+    """
+    Pick the most reliable lookup for a stored movie
+    Returns (lookup, provider call cost, columns the result may update)
+    """
+    if movie.imdb_id:
+        return (
+            lambda: search_movie_by_imdb_id(movie.imdb_id),
+            {"tmdb": 2, "omdb": 1},
+            REFRESH_FIELDS,
+        )
+    if movie.tmdb_id:
+        return (
+            lambda: search_movie_by_tmdb_id(movie.tmdb_id),
+            {"tmdb": 1, "omdb": 1},
+            REFRESH_FIELDS,
+        )
+
+    def title_lookup():
+        movie_data = search_movie_comprehensive(movie.title)
+        # Another release of the same title is not this movie
+        if movie_data and movie.year and movie_data.get("year") != movie.year:
+            return None
+        return movie_data
+
+    return title_lookup, {"tmdb": 2, "omdb": 1}, TITLE_MATCH_REFRESH_FIELDS
+
+
+def refresh_stale_movies(
+    limit=REFRESH_LIMIT,
+    batch_size=REFRESH_BATCH_SIZE,
+    max_age_hours=REFRESH_MAX_AGE_HOURS,
+    tmdb_quota=REFRESH_TMDB_QUOTA,
+    omdb_quota=REFRESH_OMDB_QUOTA,
+):
+    """
+    Refetch ratings and metadata for the stalest movies (by last_enriched_at)
+    Stops early once a provider's call quota for this run would be exceeded
+    Returns a summary dict
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+    stale = (
+        Movie.query.filter(
+            db.or_(Movie.last_enriched_at.is_(None), Movie.last_enriched_at < cutoff)
+        )
+        .order_by(Movie.last_enriched_at.asc().nulls_first(), Movie.id)
+        .limit(limit)
+        .all()
+    )
+
+    budget = {"tmdb": tmdb_quota, "omdb": omdb_quota}
+    summary = {"selected": len(stale), "refreshed": 0, "changed": 0, "failed": 0}
+    for batch in batched(stale, batch_size):
+        for movie in batch:
+            # Don't burn through the queue (stamping rows as failed) during an outage
+            if provider_outage():
+                db.session.commit()
+                summary["provider_unavailable"] = True
+                return summary
+            lookup, cost, fields = refresh_lookup(movie)
+            if any(budget[provider] < calls for provider, calls in cost.items()):
+                db.session.commit()
+                summary["quota_exhausted"] = True
+                return summary
+            for provider, calls in cost.items():
+                budget[provider] -= calls
+
+            movie_data = lookup()
+            # Stamp failures too so one unmatched title can't starve the queue
+            movie.last_enriched_at = datetime.utcnow()
+            if not movie_data:
+                summary["failed"] += 1
+                continue
+            summary["refreshed"] += 1
+            if apply_movie_data(movie, movie_data, fields):
+                summary["changed"] += 1
+        db.session.commit()
+    return summary
+
+
+@app.cli.command("refresh-stale")
+@click.option("--limit", default=REFRESH_LIMIT, show_default=True)
+@click.option("--max-age-hours", default=REFRESH_MAX_AGE_HOURS, show_default=True)
+@click.option("--loop", is_flag=True, help="Keep running, one pass per interval")
+@click.option("--interval", default=3600, show_default=True, help="Seconds")
+def refresh_stale_command(limit, max_age_hours, loop, interval):
+    """Refresh ratings and metadata for the movies fetched longest ago"""
+    while True:
+        summary = refresh_stale_movies(limit=limit, max_age_hours=max_age_hours)
+        print(f"Refresh run: {summary}", flush=True)
+        db.session.remove()
+        if not loop:
+            break
+        time.sleep(interval)
+
+
+# Collection export / import
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+TRANSFER_BATCH_SIZE = int(os.getenv("TRANSFER_BATCH_SIZE", "1000"))
+
+
+def transfer_columns():
+    """Movie columns carried by snapshots (the primary key is environment specific)"""
+    return [column for column in Movie.__table__.columns if column.name != "id"]
+
+
+def iter_movie_batches(batch_size=TRANSFER_BATCH_SIZE):
+    """Yield lists of raw movie rows, read through a server-side cursor"""
+    result = db.session.execute(
+        db.select(*transfer_columns())
+        .order_by(Movie.id)
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+
+def export_value(value):
+    """JSON/CSV friendly representation of a column value"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(batches):
+    for batch in batches:
+        yield "".join(
+            json.dumps({key: export_value(value) for key, value in row.items()}) + "\n"
+            for row in batch
+        )
+
+
+def iter_csv(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column.name for column in transfer_columns())
+    for batch in batches:
+        writer.writerows(
+            ["" if value is None else export_value(value) for value in row.values()]
+            for row in batch
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back out in chunks"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def parquet_schema():
+    import pyarrow as pa
+
+    types = {
+        db.Integer: pa.int64(),
+        db.Float: pa.float64(),
+        db.Boolean: pa.bool_(),
+        db.DateTime: pa.timestamp("us"),
+    }
+    return pa.schema(
+        [
+            (
+                column.name,
+                next(
+                    (t for base, t in types.items() if isinstance(column.type, base)),
+                    pa.string(),
+                ),
+            )
+            for column in transfer_columns()
+        ]
+    )
+
+
+def iter_parquet(batches):
+    """Stream a Parquet file, one row group per batch (requires pyarrow)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    for batch in batches:
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def export_stream(export_format, batch_size=TRANSFER_BATCH_SIZE):
+    writers = {"ndjson": iter_ndjson, "csv": iter_csv, "parquet": iter_parquet}
+    return writers[export_format](iter_movie_batches(batch_size))
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def coerce_import_row(record):
+    """Convert a snapshot record (JSON, CSV or Parquet) into Movie column values"""
+    row = {}
+    for column in transfer_columns():
+        if column.name not in record:
+            continue
+        value = record[column.name]
+        if value == "" or value is None:
+            row[column.name] = None
+            continue
+        if column.name == "sources" and isinstance(value, list):
+            value = json.dumps(value)
+        elif column.name == "tags" and isinstance(value, list):
+            value = ", ".join(value)
+        elif isinstance(column.type, db.Boolean) and isinstance(value, str):
+            value = value.lower() in ("true", "1", "yes")
+        elif isinstance(column.type, db.Integer):
+            value = int(value)
+        elif isinstance(column.type, db.Float):
+            value = float(value)
+        elif isinstance(column.type, db.DateTime):
+            value = parse_datetime(value)
+        row[column.name] = value
+    if "imdb_score" in row:
+        row["imdb_rating"] = parse_imdb_rating(row["imdb_score"])
+    return row
+
+
+def read_snapshot(stream, import_format):
+    """Yield import rows from a binary snapshot stream"""
+    if import_format == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(stream)
+        for batch in parquet_file.iter_batches(batch_size=TRANSFER_BATCH_SIZE):
+            for record in batch.to_pylist():
+                yield coerce_import_row(record)
+        return
+
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if import_format == "csv":
+        for record in csv.DictReader(text):
+            yield coerce_import_row(record)
+    else:
+        for line in text:
+            if line.strip():
+                yield coerce_import_row(json.loads(line))
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_match_keys(row):
+    """
+    Keys a snapshot row is matched on: its tmdb_id / imdb_id, or (title, year)
+    when it has neither, so re-importing a backup doesn't duplicate such movies
+    """
+    keys = [(name, row[name]) for name in ("tmdb_id", "imdb_id") if row.get(name)]
+    if not keys and row.get("title"):
+        keys = [("title_year", (row["title"], row.get("year")))]
+    return keys
+
+
+def import_movies_executemany(rows, batch_size=TRANSFER_BATCH_SIZE):
+    """
+    Upsert snapshot rows (see import_match_keys) with batched executemany
+    Later rows win over earlier ones with the same key. Returns (inserted, updated)
+    """
+    inserted = updated = 0
+    for batch in batched(rows, batch_size):
+        tmdb_ids = {row["tmdb_id"] for row in batch if row.get("tmdb_id")}
+        imdb_ids = {row["imdb_id"] for row in batch if row.get("imdb_id")}
+        titles = {
+            row["title"]
+            for row in batch
+            if row.get("title") and not row.get("tmdb_id") and not row.get("imdb_id")
+        }
+        existing = Movie.query.with_entities(
+            Movie.id, Movie.tmdb_id, Movie.imdb_id, Movie.title, Movie.year
+        ).filter(
+            db.or_(
+                Movie.tmdb_id.in_(tmdb_ids),
+                Movie.imdb_id.in_(imdb_ids),
+                db.and_(
+                    Movie.tmdb_id.is_(None),
+                    Movie.imdb_id.is_(None),
+                    Movie.title.in_(titles),
+                ),
+            )
+        )
+        existing_ids = {}
+        for movie in existing:
+            keys = import_match_keys(movie._asdict())
+            existing_ids.update({key: movie.id for key in keys})
+
+        updates, inserts, pending = {}, [], {}
+        for row in batch:
+            keys = import_match_keys(row)
+            movie_id = next(
+                (existing_ids[key] for key in keys if key in existing_ids), None
+            )
+            if movie_id:
+                updates.setdefault(movie_id, {"id": movie_id}).update(row)
+            elif any(key in pending for key in keys):
+                # Duplicate of a row inserted earlier in this batch
+                pending[next(key for key in keys if key in pending)].update(row)
+            else:
+                inserts.append(row)
+                pending.update({key: row for key in keys})
+
+        if updates:
+            db.session.execute(update(Movie), list(updates.values()))
+        new_ids = []
+        if inserts:
+            new_ids = db.session.scalars(
+                insert(Movie).returning(Movie.id), inserts
+            ).all()
+        rebuild_movie_labels(list(updates) + list(new_ids))
+        inserted += len(inserts)
+        updated += len(updates)
+    return inserted, updated
+
+
+class _CsvRowStream:
+    """
+    File-like object producing CSV text from rows, for COPY ... FROM STDIN
+    An error raised by the rows (e.g. a bad value) ends the stream and is kept in
+    `error`, since psycopg2 would report it as a cancelled COPY
+    """
+
+    def __init__(self, rows, columns):
+        self.rows = iter(rows)
+        self.columns = columns
+        self.error = None
+        self.buffer = ""
+        self.output = io.StringIO()
+        self.writer = csv.writer(self.output)
+
+    def next_row(self):
+        row = next(self.rows, None)
+        if row is not None and row.keys() != set(self.columns):
+            raise ValueError(
+                f"every row must have the same fields as the first: {self.columns}"
+            )
+        return row
+
+    def read(self, size=-1):
+        while self.error is None and (size < 0 or len(self.buffer) < size):
+            try:
+                row = self.next_row()
+            except Exception as e:
+                self.error = e
+                break
+            if row is None:
+                break
+            self.writer.writerow(
+                [
+                    "\\N" if row[name] is None else export_value(row[name])
+                    for name in self.columns
+                ]
+            )
+            self.buffer += self.output.getvalue()
+            self.output.seek(0)
+            self.output.truncate()
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+
+# Duplicate snapshot rows for each import_match_keys key, all but the last
+IMPORT_DUPLICATE_KEYS = {
+    "tmdb_id": "tmdb_id IS NOT NULL",
+    "imdb_id": "imdb_id IS NOT NULL",
+    "title, year": "tmdb_id IS NULL AND imdb_id IS NULL AND title IS NOT NULL",
+}
+
+
+def import_movies_copy(rows):
+    """
+    Postgres fast path: COPY rows into a temporary table, drop duplicates (the
+    last row per key wins, as with executemany), then upsert with one set-based
+    UPDATE and one INSERT. Only the snapshot's columns are written, so the others
+    keep their values on update and get their defaults on insert. Every row must
+    have the columns of the first. Returns (inserted, updated)
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0, 0
+    staged_columns = [column.name for column in transfer_columns()]
+    columns = [name for name in staged_columns if name in first]
+
+    movie = Movie.__table__
+    staged = db.table(
+        "movie_import", *(db.column(name) for name in staged_columns + ["import_row"])
+    )
+    match = db.or_(
+        db.and_(staged.c.tmdb_id.isnot(None), movie.c.tmdb_id == staged.c.tmdb_id),
+        db.and_(staged.c.imdb_id.isnot(None), movie.c.imdb_id == staged.c.imdb_id),
+        db.and_(
+            staged.c.tmdb_id.is_(None),
+            staged.c.imdb_id.is_(None),
+            movie.c.tmdb_id.is_(None),
+            movie.c.imdb_id.is_(None),
+            movie.c.title == staged.c.title,
+            movie.c.year.is_not_distinct_from(staged.c.year),
+        ),
+    )
+
+    connection = db.session.connection()
+    cursor = connection.connection.dbapi_connection.cursor()
+    cursor.execute(
+        f"CREATE TEMP TABLE movie_import ON COMMIT DROP AS "
+        f"SELECT {', '.join(staged_columns)} FROM movie WITH NO DATA"
+    )
+    # Numbers rows in snapshot order, so "last" is well defined
+    cursor.execute("ALTER TABLE movie_import ADD COLUMN import_row BIGSERIAL")
+    stream = _CsvRowStream(itertools.chain([first], rows), columns)
+    cursor.copy_expert(
+        f"COPY movie_import ({', '.join(columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        stream,
+    )
+    if stream.error is not None:
+        cursor.close()
+        raise stream.error
+    for key, condition in IMPORT_DUPLICATE_KEYS.items():
+        cursor.execute(
+            f"DELETE FROM movie_import WHERE import_row IN ("
+            f"SELECT import_row FROM (SELECT import_row, ROW_NUMBER() OVER "
+            f"(PARTITION BY {key} ORDER BY import_row DESC) AS n "
+            f"FROM movie_import WHERE {condition}) d WHERE n > 1)"
+        )
+    cursor.close()
+
+    updated_ids = connection.execute(
+        update(movie)
+        .values({name: staged.c[name] for name in columns})
+        .where(match)
+        .returning(movie.c.id)
+    ).scalars()
+    updated_ids = list(updated_ids)
+    # from_select adds the column defaults (date_added, watched, ...) left out
+    inserted_ids = connection.execute(
+        insert(movie)
+        .from_select(
+            columns,
+            db.select(*(staged.c[name] for name in columns)).where(
+                ~db.exists().where(match)
+            ),
+        )
+        .returning(movie.c.id)
+    ).scalars()
+    inserted_ids = list(inserted_ids)
+
+    rebuild_movie_labels(updated_ids + inserted_ids)
+    return len(inserted_ids), len(set(updated_ids))
+
+
+def import_movies(rows):
+    """Import snapshot rows with COPY on Postgres, batched executemany elsewhere"""
+    # COPY bypasses the ORM, so the change tracking listeners can't see the rows
+    db.session.info["collection_changed"] = True
+    db.session.info["collection_bulk"] = True
+    db.session.info["suggest_stale"] = True
+    if db.engine.dialect.name == "postgresql":
+        return import_movies_copy(rows)
+    return import_movies_executemany(rows)
+
+
+@app.route("/movies/export", methods=["GET"])
+@role_required("admin")
+@read_replica
+def export_movies():
+    """Stream the whole collection as NDJSON, CSV or Parquet"""
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {list(EXPORT_FORMATS)}"}), 400
+    if export_format == "parquet" and not parquet_available():
+        return jsonify({"error": "Parquet export requires pyarrow"}), 501
+
+    return Response(
+        stream_with_context(export_stream(export_format)),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f"attachment; filename=movies.{export_format}"},
+    )
+
+
+@app.route("/movies/import", methods=["POST"])
+@role_required("admin")
+def import_movies_route():
+    """Load a snapshot produced by /movies/export, see import_match_keys"""
+    import_format = request.args.get("format", "ndjson")
+    if import_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"format must be one of {list(EXPORT_FORMATS)}"}), 400
+    if import_format == "parquet" and not parquet_available():
+        return jsonify({"error": "Parquet import requires pyarrow"}), 501
+
+    # Parquet needs a seekable file, the text formats are read as they arrive
+    stream = request.stream
+    if import_format == "parquet":
+        stream = io.BytesIO(request.get_data())
+    try:
+        inserted, updated = import_movies(read_snapshot(stream, import_format))
+    except (ValueError, KeyError) as e:
+        db.session.rollback()
+        return jsonify({"error": f"Invalid snapshot: {e}"}), 400
+    db.session.commit()
+    return jsonify({"inserted": inserted, "updated": updated})
+
+
+@app.cli.command("export-movies")
+@click.option("--format", "export_format", type=click.Choice(list(EXPORT_FORMATS)))
+@click.option("--output", type=click.Path(dir_okay=False), help="Defaults to stdout")
+def export_movies_command(export_format, output):
+    """Write the whole collection to a snapshot file"""
+    export_format = export_format or "ndjson"
+    target = open(output, "wb") if output else nullcontext(sys.stdout.buffer)
+    with target as stream:
+        for chunk in export_stream(export_format):
+            stream.write(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+
+
+@app.cli.command("import-movies")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "import_format", type=click.Choice(list(EXPORT_FORMATS)))
+def import_movies_command(path, import_format):
+    """Load a snapshot file, upserting on tmdb_id / imdb_id or (title, year)"""
+    import_format = import_format or os.path.splitext(path)[1].lstrip(".")
+    if import_format not in EXPORT_FORMATS:
+        raise click.BadParameter("cannot infer format, pass --format")
+    with open(path, "rb") as stream:
+        inserted, updated = import_movies(read_snapshot(stream, import_format))
+    db.session.commit()
+    print(f"Imported {inserted} new and {updated} updated movies")
+
+
 @app.route("/init-users", methods=["POST"])
 def init_demo_users():
     """Initialize demo users - only for development"""
@@ -0,0 +1,90 @@
+# cache.py
+"""
+Two-tier cache for rendered API responses
+
+Entries are (status, mimetype, body) tuples. The local tier is an in-process LRU
+bounded by total body size. The optional shared tier is Redis, so every worker
+process benefits from a response rendered by any of them. Keys carry the
+collection generation, so entries are never updated in place: a write bumps the
+generation and old entries simply stop being asked for and age out.
+"""
+
+import threading
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # The shared tier is optional
+    redis = None
+
+
+class ResponseCache:
+    def __init__(
+        self, max_bytes=64 * 1024 * 1024, redis_url=None, ttl=3600, prefix="movie_db:"
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl  # Seconds a shared entry lives
+        self.prefix = prefix
+        self.local = OrderedDict()
+        self.local_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+        self.shared = None
+        if redis_url and redis is None:
+            print("Warning: CACHE_REDIS_URL is set but redis is not installed")
+        elif redis_url:
+            self.shared = redis.Redis.from_url(
+                redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+
+    def get(self, key):
+        """(status, mimetype, body) for key, or None"""
+        with self.lock:
+            entry = self.local.get(key)
+            if entry is not None:
+                self.local.move_to_end(key)
+                self.stats["local_hits"] += 1
+                return entry
+
+        if self.shared is not None:
+            try:
+                raw = self.shared.get(self.prefix + key)
+            except redis.RedisError as e:
+                print(f"Response cache: Redis read failed: {e}")
+                raw = None
+            if raw is not None:
+                status, mimetype, body = raw.split(b"\n", 2)
+                entry = (int(status), mimetype.decode(), body)
+                self.store_local(key, entry)
+                with self.lock:
+                    self.stats["shared_hits"] += 1
+                return entry
+
+        with self.lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, key, status, mimetype, body):
+        entry = (status, mimetype, body)
+        self.store_local(key, entry)
+        if self.shared is not None:
+            raw = f"{status}\n{mimetype}\n".encode() + body
+            try:
+                self.shared.set(self.prefix + key, raw, ex=self.ttl)
+            except redis.RedisError as e:
+                print(f"Response cache: Redis write failed: {e}")
+
+    def store_local(self, key, entry):
+        size = len(entry[2])
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.local.pop(key, None)
+            if previous is not None:
+                self.local_bytes -= len(previous[2])
+            self.local[key] = entry
+            self.local_bytes += size
+            while self.local_bytes > self.max_bytes:
+                _, evicted = self.local.popitem(last=False)
+                self.local_bytes -= len(evicted[2])
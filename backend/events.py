@@ -0,0 +1,112 @@
+# events.py
+"""
+Fan-out of collection change events to server-sent event streams
+
+EventBroker hands every published event to each subscribed stream in this
+process. With PostgreSQL, events are sent with NOTIFY inside the writing
+transaction and a PgListener thread per process feeds them to the local broker,
+so clients connected to any worker see changes made by every other worker.
+"""
+
+import json
+import queue
+import select
+import threading
+import time
+
+CHANNEL = "movie_events"
+# NOTIFY payloads must stay below 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+
+class Subscriber:
+    def __init__(self, max_queued):
+        self.queue = queue.Queue(maxsize=max_queued)
+        self.overflowed = False
+
+
+class EventBroker:
+    """In-process publish/subscribe for change events"""
+
+    def __init__(self, max_queued=1000):
+        self.max_queued = max_queued
+        self.subscribers = set()
+        self.lock = threading.Lock()
+
+    def subscribe(self):
+        subscriber = Subscriber(self.max_queued)
+        with self.lock:
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, event):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait(event)
+            except queue.Full:
+                # A stalled client; its stream ends and it resyncs on reconnect
+                subscriber.overflowed = True
+
+
+def encode_event(event):
+    """
+    JSON payload for NOTIFY
+    Events too large for a notification are replaced by an invalidation, so
+    clients reload the collection instead
+    """
+    payload = json.dumps(event, default=str)
+    if len(payload.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"generation": event["generation"], "invalidate": True})
+    return payload
+
+
+class PgListener:
+    """Background thread that LISTENs on CHANNEL and publishes to a broker"""
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.dsn = None
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def ensure_started(self, dsn):
+        """Start listening on the database at dsn, unless already listening"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.dsn = dsn
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def run(self):
+        import psycopg2
+
+        reconnecting = False
+        while True:
+            connection = None
+            try:
+                connection = psycopg2.connect(self.dsn)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                if reconnecting:
+                    # Events sent while we were disconnected are lost
+                    self.broker.publish({"generation": None, "invalidate": True})
+                while True:
+                    if select.select([connection], [], [], 30) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        self.broker.publish(json.loads(notify.payload))
+            except Exception as e:
+                print(f"Event listener lost its database connection: {e}")
+                if connection is not None:
+                    connection.close()
+                reconnecting = True
+                time.sleep(5)
@@ -0,0 +1,50 @@
+# gunicorn.conf.py
+"""
+gunicorn settings, loaded from the working directory or with -c gunicorn.conf.py
+
+Provider lookups (/movies/search, /movies/search/imdb, /movies/<id>/enhanced)
+wait seconds on TMDB/OMDB and /movies/events streams stay open for minutes, so
+sync workers would let a handful of them block every catalog read.
+GUNICORN_WORKER_CLASS selects one of:
+- gevent (default): every request runs in a greenlet, so one worker holds
+  hundreds of in-flight provider calls and open streams while still serving
+  reads. The worker monkey patches the standard library and post_fork makes
+  psycopg2 cooperative with psycogreen. Request profiles get no stack samples
+  under gevent, as the sampler reads OS thread stacks
+- gthread: GUNICORN_THREADS OS threads per worker. Every open stream holds one
+  of them, so GUNICORN_THREADS open tabs leave no thread for reads
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+# Concurrent requests per gevent worker
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+# Request threads per gthread worker
+threads = int(os.getenv("GUNICORN_THREADS", "64"))
+if worker_class == "gthread":
+    # Every thread may hold a database connection; workers inherit the env
+    os.environ.setdefault("DB_POOL_SIZE", str(threads))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+keepalive = 5
+
+
+def post_fork(server, worker):
+    if "gevent" in server.cfg.worker_class_str:
+        from psycogreen.gevent import patch_psycopg
+
+        # psycopg2 waits on sockets in C, yield to other greenlets instead
+        patch_psycopg()
+
+
+def post_worker_init(worker):
+    # Build the typeahead index before the first request instead of during it
+    from app import app, build_suggest_index, collection_generation
+
+    try:
+        with app.app_context():
+            build_suggest_index(collection_generation())
+    except Exception as e:
+        print(f"Typeahead index not built at startup: {e}")
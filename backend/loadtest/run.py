@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test: gunicorn + the Flask app + a stub TMDB/OMDB server
+
+Seeds a database, then for every worker/thread combination starts gunicorn,
+drives a weighted mix of API traffic from concurrent clients and reports
+throughput and p50/p95/p99 latency per route. Run from the backend directory:
+    python loadtest/run.py --workers 1,2,4 --threads 1,4 --duration 30
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+import requests
+
+import stub_server
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENRES = ["Action", "Drama", "Comedy", "Crime", "Sci-Fi", "Thriller", "Romance"]
+DIRECTORS = ["Christopher Nolan", "Greta Gerwig", "Denis Villeneuve", "Bong Joon-ho"]
+ACTORS = ["Tom Hardy", "Florence Pugh", "Song Kang-ho", "Zendaya", "Cillian Murphy"]
+TAGS = ["favorite", "watchlist", "classic", "rewatch"]
+SOURCES = ["Apple TV", "UHD Disk", "Blu-ray", "Netflix"]
+
+# Relative weight of each route in the traffic mix
+DEFAULT_MIX = {
+    "login": 5,
+    "movies": 25,
+    "filter": 25,
+    "stats": 15,
+    "enhanced": 20,
+    "search": 10,
+}
+
+
+def seed_database(database_url, movie_count):
+    """Create tables, the admin user and movie_count movies"""
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, BACKEND_DIR)
+    from app import Movie, User, app, db, sync_movie_labels
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        admin = User(username="admin", email="admin@example.com", role="admin")
+        admin.set_password("admin")
+        db.session.add(admin)
+
+        rng = random.Random(42)
+        for i in range(movie_count):
+            movie = Movie(
+                title=f"Seed Movie {i}",
+                year=str(rng.randint(1950, 2024)),
+                genre=", ".join(rng.sample(GENRES, 2)),
+                director=rng.choice(DIRECTORS),
+                actors=", ".join(rng.sample(ACTORS, 3)),
+                imdb_score=f"{rng.uniform(4, 9.5):.1f}",
+                tags=", ".join(rng.sample(TAGS, rng.randint(0, 2))),
+                sources=json.dumps(rng.sample(SOURCES, rng.randint(1, 2))),
+                # Half the movies have no TMDB data yet, so /enhanced fetches it
+                tmdb_id=rng.randint(1, 10**6) if i % 2 else None,
+            )
+            sync_movie_labels(movie)
+            db.session.add(movie)
+        db.session.commit()
+        db.engine.dispose()
+
+
+def request_for(route, movie_count, rng):
+    """(method, path, kwargs) for one request of the given route"""
+    if route == "login":
+        return (
+            "POST",
+            "/auth/login",
+            {"json": {"username": "admin", "password": "admin"}},
+        )
+    if route == "movies":
+        return "GET", "/movies", {}
+    if route == "filter":
+        params = rng.choice(
+            [
+                {"genre": rng.choice(GENRES)},
+                {"director": rng.choice(DIRECTORS).split()[-1]},
+                {"actor": rng.choice(ACTORS)},
+                {"min_rating": rng.choice(["6.0", "7.0", "8.0"])},
+                {"tag": rng.choice(TAGS)},
+                {"source": rng.choice(SOURCES), "genre": rng.choice(GENRES)},
+            ]
+        )
+        return "GET", "/movies/filter", {"params": params}
+    if route == "stats":
+        return "GET", "/movies/stats", {}
+    if route == "enhanced":
+        return "GET", f"/movies/{rng.randint(1, movie_count)}/enhanced", {}
+    if route == "search":
+        return (
+            "GET",
+            "/movies/search",
+            {"params": {"title": f"Load {uuid.uuid4().hex}"}},
+        )
+    raise ValueError(f"unknown route {route}")
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(
+        0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def drive(base_url, clients, duration, warmup, mix, movie_count):
+    """Run the traffic mix; returns {route: [(status, seconds), ...]}"""
+    routes, weights = zip(*mix.items())
+    samples = {route: [] for route in routes}
+    lock = threading.Lock()
+    start = time.monotonic()
+    record_from = start + warmup
+    deadline = record_from + duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        http = requests.Session()
+        http.post(
+            f"{base_url}/auth/login",
+            json={"username": "admin", "password": "admin"},
+            timeout=30,
+        )
+        while time.monotonic() < deadline:
+            route = rng.choices(routes, weights)[0]
+            method, path, kwargs = request_for(route, movie_count, rng)
+            began = time.monotonic()
+            try:
+                status = http.request(
+                    method, base_url + path, timeout=60, **kwargs
+                ).status_code
+            except requests.RequestException:
+                status = 0
+            finished = time.monotonic()
+            if began >= record_from:
+                with lock:
+                    samples[route].append((status, finished - began))
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def summarize(samples, duration):
+    """Per-route throughput, error count and latency percentiles (ms)"""
+    report = {}
+    all_latencies = []
+    for route, results in samples.items():
+        latencies = sorted(seconds * 1000 for _, seconds in results)
+        all_latencies += latencies
+        report[route] = {
+            "requests": len(results),
+            # 409 is expected when a search hits an existing title
+            "errors": sum(1 for status, _ in results if status == 0 or status >= 500),
+            "rps": len(results) / duration,
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+        }
+    all_latencies.sort()
+    report["total"] = {
+        "requests": len(all_latencies),
+        "errors": sum(r["errors"] for r in report.values()),
+        "rps": len(all_latencies) / duration,
+        "p50": percentile(all_latencies, 0.50),
+        "p95": percentile(all_latencies, 0.95),
+        "p99": percentile(all_latencies, 0.99),
+    }
+    return report
+
+
+def print_report(label, report):
+    print(f"\n{label}")
+    print(
+        f"{'route':<10} {'reqs':>7} {'errs':>5} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for route, row in report.items():
+        latencies = [
+            f"{row[key]:8.1f}" if row[key] is not None else f"{'-':>8}"
+            for key in ("p50", "p95", "p99")
+        ]
+        print(
+            f"{route:<10} {row['requests']:>7} {row['errors']:>5} "
+            f"{row['rps']:>8.1f} {' '.join(latencies)}"
+        )
+
+
+def start_gunicorn(port, workers, threads, worker_class, env):
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "--workers",
+        str(workers),
+        "--threads",
+        str(threads),
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--log-level",
+        "warning",
+    ]
+    # Default to sync (gthread with --threads > 1) over gunicorn.conf.py's choice
+    command += ["--worker-class", worker_class or "sync"]
+    process = subprocess.Popen(command + ["app:app"], cwd=BACKEND_DIR, env=env)
+
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(150):
+        if process.poll() is not None:
+            raise RuntimeError("gunicorn exited during startup")
+        try:
+            requests.get(f"{base_url}/auth/check", timeout=1)
+            return process, base_url
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("gunicorn did not become ready")
+
+
+def int_list(value):
+    return [int(item) for item in value.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        help="Defaults to a throwaway SQLite file; use PostgreSQL for realistic numbers",
+    )
+    parser.add_argument("--workers", type=int_list, default=[1, 2])
+    parser.add_argument("--threads", type=int_list, default=[1, 4])
+    parser.add_argument("--worker-class", help="gunicorn worker class override")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20, help="Seconds")
+    parser.add_argument("--warmup", type=float, default=2, help="Seconds")
+    parser.add_argument("--movies", type=int, default=500, help="Seeded movies")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--stub-port", type=int, default=8765)
+    parser.add_argument("--stub-latency-ms", type=float, default=150)
+    parser.add_argument("--stub-jitter-ms", type=float, default=50)
+    parser.add_argument("--stub-error-rate", type=float, default=0.02)
+    parser.add_argument(
+        "--mix",
+        type=json.loads,
+        default=DEFAULT_MIX,
+        help=f"JSON route weights, default {json.dumps(DEFAULT_MIX)}",
+    )
+    parser.add_argument("--json", dest="json_path", help="Also write results here")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = f"sqlite:///{tempfile.mkdtemp()}/loadtest.db"
+
+    stub, _ = stub_server.start_in_thread(
+        port=args.stub_port,
+        latency_ms=args.stub_latency_ms,
+        jitter_ms=args.stub_jitter_ms,
+        error_rate=args.stub_error_rate,
+    )
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        TMDB_API_KEY="stub",
+        OMDB_API_KEY="stub",
+        TMDB_API_URL=f"http://127.0.0.1:{args.stub_port}/3",
+        OMDB_API_URL=f"http://127.0.0.1:{args.stub_port}/omdb/",
+    )
+
+    results = []
+    try:
+        for workers in args.workers:
+            for threads in args.threads:
+                # Reseed so every configuration starts from the same data
+                seed_database(database_url, args.movies)
+                process, base_url = start_gunicorn(
+                    args.port, workers, threads, args.worker_class, env
+                )
+                try:
+                    samples = drive(
+                        base_url,
+                        args.clients,
+                        args.duration,
+                        args.warmup,
+                        args.mix,
+                        args.movies,
+                    )
+                finally:
+                    process.terminate()
+                    process.wait()
+
+                report = summarize(samples, args.duration)
+                print_report(
+                    f"workers={workers} threads={threads} clients={args.clients}",
+                    report,
+                )
+                results.append(
+                    {"workers": workers, "threads": threads, "report": report}
+                )
+    finally:
+        stub.shutdown()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the TMDB and OMDB APIs used by load tests
+
+Replays the recorded responses in fixtures/ with configurable latency and
+error rate. Point the backend at it with:
+    TMDB_API_URL=http://127.0.0.1:8765/3 OMDB_API_URL=http://127.0.0.1:8765/omdb/
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, f"{name}.json")) as f:
+        return json.load(f)
+
+
+class StubState:
+    """Recorded responses plus the latency / failure settings shared by handlers"""
+
+    def __init__(self, latency_ms=100, jitter_ms=50, error_rate=0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.fixtures = {
+            name: load_fixture(name)
+            for name in ("tmdb_search", "tmdb_details", "tmdb_find", "omdb")
+        }
+        # TMDB ID -> title, so details match the title that was searched for
+        self.titles = {}
+        self.lock = threading.Lock()
+        self.counts = {}
+
+    def count(self, route):
+        with self.lock:
+            self.counts[route] = self.counts.get(route, 0) + 1
+
+
+def title_id(title):
+    """Stable fake TMDB ID for a title so every searched title is a distinct movie"""
+    return zlib.crc32(title.encode("utf-8")) % 10_000_000 + 1
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state = None  # Set by make_server()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        state = self.state
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        delay = state.latency_ms + random.uniform(-state.jitter_ms, state.jitter_ms)
+        time.sleep(max(delay, 0) / 1000)
+
+        if random.random() < state.error_rate:
+            state.count("error")
+            status = random.choice([429, 500, 502, 503])
+            return self.send_json(status, {"status_message": "stub failure"})
+
+        if parts[:1] == ["omdb"]:
+            return self.omdb(params)
+        if parts[:3] == ["3", "search", "movie"]:
+            return self.tmdb_search(params)
+        if parts[:2] == ["3", "movie"] and len(parts) == 3:
+            return self.tmdb_details(int(parts[2]))
+        if parts[:2] == ["3", "find"] and len(parts) == 3:
+            return self.tmdb_find(parts[2])
+
+        state.count("unknown")
+        self.send_json(404, {"status_message": "not found"})
+
+    def tmdb_search(self, params):
+        self.state.count("tmdb_search")
+        body = copy.deepcopy(self.state.fixtures["tmdb_search"])
+        title = params.get("query", "")
+        movie_id = title_id(title)
+        with self.state.lock:
+            self.state.titles[movie_id] = title
+        body["results"][0].update(id=movie_id, title=title, original_title=title)
+        self.send_json(200, body)
+
+    def tmdb_details(self, movie_id):
+        self.state.count("tmdb_details")
+        body = copy.deepcopy(self.state.fixtures["tmdb_details"])
+        title = self.state.titles.get(movie_id, body["title"])
+        body.update(id=movie_id, title=title, imdb_id=f"tt{movie_id:07d}")
+        self.send_json(200, body)
+
+    def tmdb_find(self, imdb_id):
+        self.state.count("tmdb_find")
+        body = copy.deepcopy(self.state.fixtures["tmdb_find"])
+        body["movie_results"][0]["id"] = int(imdb_id.lstrip("t") or 0)
+        self.send_json(200, body)
+
+    def omdb(self, params):
+        self.state.count("omdb")
+        body = copy.deepcopy(self.state.fixtures["omdb"])
+        if params.get("t"):
+            body["Title"] = params["t"]
+        if params.get("i"):
+            body["imdbID"] = params["i"]
+        self.send_json(200, body)
+
+
+def make_server(host="127.0.0.1", port=8765, **settings):
+    """Create (but don't start) a stub server; returns (server, state)"""
+    state = StubState(**settings)
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server, state
+
+
+def start_in_thread(host="127.0.0.1", port=8765, **settings):
+    """Run a stub server on a daemon thread; returns (server, state)"""
+    server, state = make_server(host, port, **settings)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--jitter-ms", type=float, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, _ = make_server(
+        args.host,
+        args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+    )
+    print(f"Stub TMDB/OMDB listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# profiling.py
+"""
+Opt-in profiler for single requests
+
+A RequestProfile samples the stack of the thread serving the request at a fixed
+interval and counts each stack in folded form ("outer;inner;leaf" -> samples),
+which flamegraph.pl, speedscope and similar tools read directly. While it is
+active it also records every SQL statement and outbound provider call made on
+behalf of the request, including from worker threads started with propagate().
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# The profile of the request being served, if it is being profiled
+current_profile = ContextVar("current_profile", default=None)
+
+MAX_STATEMENT_LENGTH = 2000
+
+
+def frame_label(frame):
+    code = frame.f_code
+    return (
+        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+class RequestProfile:
+    """Stack samples, SQL statements and provider calls for one request"""
+
+    def __init__(self, interval=0.005):
+        self.id = uuid.uuid4().hex[:16]
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.samples = {}
+        self.queries = []
+        self.calls = []
+        self.started_at = datetime.now(timezone.utc)
+        self.started = None
+        self.duration = None
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self.sample, daemon=True)
+        self.token = None
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.token = current_profile.set(self)
+        self.sampler.start()
+
+    def stop(self):
+        self.duration = time.perf_counter() - self.started
+        self.stopped.set()
+        self.sampler.join()
+        current_profile.reset(self.token)
+
+    def sample(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                folded = ";".join(reversed(stack))
+                self.samples[folded] = self.samples.get(folded, 0) + 1
+
+    def record_query(self, statement, seconds, rowcount):
+        self.queries.append(
+            {
+                "statement": statement[:MAX_STATEMENT_LENGTH],
+                "ms": round(seconds * 1000, 3),
+                "rows": rowcount,
+            }
+        )
+
+    def record_call(self, call):
+        self.calls.append(call)
+
+    def to_dict(self, **request_info):
+        return {
+            "id": self.id,
+            **request_info,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration * 1000, 3),
+            "interval_ms": self.interval * 1000,
+            "sql": {
+                "count": len(self.queries),
+                "total_ms": round(sum(q["ms"] for q in self.queries), 3),
+                "statements": self.queries,
+            },
+            "calls": {
+                "count": len(self.calls),
+                "total_ms": round(sum(c["ms"] for c in self.calls), 3),
+                "requests": self.calls,
+            },
+            "samples": self.samples,
+        }
+
+
+def folded_stacks(samples):
+    """Samples in folded stack format, one "stack count" line per stack"""
+    return "".join(f"{stack} {count}\n" for stack, count in samples.items())
+
+
+def propagate(fn):
+    """Wrap fn so calls it makes on another thread count toward the current profile"""
+    profile = current_profile.get()
+
+    def run(*args, **kwargs):
+        token = current_profile.set(profile)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            current_profile.reset(token)
+
+    return run
+
+
+def record_provider_call(call):
+    """ProviderClient observer: attach the call to the current profile"""
+    profile = current_profile.get()
+    if profile is not None:
+        profile.record_call(call)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if current_profile.get() is not None:
+        conn.info.setdefault("profile_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_query(conn, cursor, statement, parameters, context, executemany):
+    profile = current_profile.get()
+    if profile is None or not conn.info.get("profile_query_start"):
+        return
+    started = conn.info["profile_query_start"].pop()
+    profile.record_query(statement, time.perf_counter() - started, cursor.rowcount)
+
+
+class ProfileStore:
+    """Profiles on disk as <id>.json, keeping the most recent `keep`"""
+
+    def __init__(self, directory, keep=100):
+        self.directory = directory
+        self.keep = keep
+
+    def path(self, profile_id):
+        # IDs are hex, reject anything that could escape the directory
+        if not profile_id.isalnum():
+            return None
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def save(self, data):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(data["id"]), "w") as f:
+            json.dump(data, f)
+        self.prune()
+
+    def load(self, profile_id):
+        path = self.path(profile_id)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def list(self):
+        """Stored profiles, newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        ]
+        return sorted(paths, key=os.path.getmtime, reverse=True)
+
+    def prune(self):
+        for path in self.list()[self.keep :]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
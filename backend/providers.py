@@ -0,0 +1,229 @@
+# providers.py
+"""
+HTTP client for the external movie data providers (TMDB, OMDB)
+
+Every call has a deadline, retries 429/5xx responses and connection errors
+with jittered exponential backoff, and goes through a per-provider circuit
+breaker. While the breaker is open calls fail fast: they return the last good
+response for the same request if one is cached, or raise ProviderUnavailable.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ProviderUnavailable(Exception):
+    """The provider is failing or its circuit breaker is open"""
+
+
+class RetryableStatus(Exception):
+    """A 429 or 5xx response worth retrying"""
+
+    def __init__(self, response):
+        super().__init__(f"{response.status_code} from {response.url}")
+        self.response = response
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failed calls, then lets a single
+    trial call through once `reset_timeout` seconds have passed (half-open)
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == "closed":
+                return True
+            if (
+                self.state == "open"
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                self.state = "half_open"
+                return True
+            # Open, or half-open with the trial call already in flight
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = "closed"
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self):
+        """Open and not yet due for a trial call"""
+        with self.lock:
+            return (
+                self.state == "open"
+                and time.monotonic() - self.opened_at < self.reset_timeout
+            )
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "open_for_seconds": round(time.monotonic() - self.opened_at, 1)
+                if self.opened_at is not None
+                else None,
+            }
+
+
+class ProviderClient:
+    """JSON GET client for one provider with deadlines, retries and a circuit breaker"""
+
+    def __init__(
+        self,
+        name,
+        base_url,
+        timeout=5.0,
+        deadline=10.0,
+        max_retries=2,
+        backoff=0.5,
+        breaker=None,
+        stale_cache_size=512,
+        pool_size=20,
+    ):
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout  # Per attempt
+        self.deadline = deadline  # For the whole call, retries included
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Last good response per request, served while the provider is down
+        self.stale_cache = OrderedDict()
+        self.stale_cache_size = stale_cache_size
+        self.lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "retries": 0,
+            "failures": 0,
+            "short_circuits": 0,
+            "stale_hits": 0,
+        }
+        # Callables given a dict describing each finished call
+        self.observers = []
+
+    def count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+    def get(self, path, params=None):
+        """GET base_url + path and return the decoded JSON body"""
+        call = {"provider": self.name, "path": path, "attempts": 0, "outcome": None}
+        started = time.perf_counter()
+        try:
+            return self.fetch(path, params, call)
+        finally:
+            if self.observers:
+                call["params"] = {
+                    key: "***" if "key" in key.lower() else value
+                    for key, value in (params or {}).items()
+                }
+                call["ms"] = round((time.perf_counter() - started) * 1000, 3)
+                for observer in self.observers:
+                    observer(call)
+
+    def fetch(self, path, params, call):
+        url = self.base_url + path
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        self.count("calls")
+
+        if not self.breaker.allow():
+            self.count("short_circuits")
+            call["outcome"] = "short_circuit"
+            return self.stale_or_raise(cache_key, "circuit open")
+
+        started = time.monotonic()
+        while True:
+            remaining = self.deadline - (time.monotonic() - started)
+            call["attempts"] += 1
+            try:
+                response = self.session.get(
+                    url, params=params, timeout=max(min(self.timeout, remaining), 0.1)
+                )
+                if response.status_code == 429 or response.status_code >= 500:
+                    raise RetryableStatus(response)
+            except (requests.ConnectionError, requests.Timeout, RetryableStatus) as e:
+                delay = self.retry_delay(call["attempts"], e)
+                elapsed = time.monotonic() - started
+                if (
+                    call["attempts"] > self.max_retries
+                    or elapsed + delay >= self.deadline
+                ):
+                    self.count("failures")
+                    self.breaker.record_failure()
+                    call["outcome"] = "failed"
+                    return self.stale_or_raise(cache_key, str(e))
+                self.count("retries")
+                time.sleep(delay)
+                continue
+            except Exception:
+                # Anything else (e.g. a truncated body) still counts as a failure,
+                # otherwise a half-open breaker would wait on its trial forever
+                self.count("failures")
+                self.breaker.record_failure()
+                call["outcome"] = "failed"
+                raise
+
+            # Any other answer means the provider is up, even a 404
+            self.breaker.record_success()
+            call["outcome"] = response.status_code
+            response.raise_for_status()
+            data = response.json()
+            with self.lock:
+                self.stale_cache[cache_key] = data
+                self.stale_cache.move_to_end(cache_key)
+                while len(self.stale_cache) > self.stale_cache_size:
+                    self.stale_cache.popitem(last=False)
+            return data
+
+    def retry_delay(self, attempt, error):
+        """Exponential backoff with jitter, honoring a numeric Retry-After header"""
+        delay = self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+        if isinstance(error, RetryableStatus):
+            retry_after = error.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+        return delay
+
+    def stale_or_raise(self, cache_key, reason):
+        with self.lock:
+            data = self.stale_cache.get(cache_key)
+        if data is not None:
+            self.count("stale_hits")
+            return data
+        raise ProviderUnavailable(f"{self.name} unavailable: {reason}")
+
+    def status(self):
+        """Breaker state and call counters, for monitoring"""
+        with self.lock:
+            stats = dict(self.stats)
+        return {**self.breaker.snapshot(), **stats}
@@ -0,0 +1,181 @@
+# suggest.py
+"""
+In-memory prefix index for typeahead over movie titles, directors and actors
+
+Every title and name is normalized (lowercase, accents and punctuation removed)
+and indexed once per word, so "knight" finds "The Dark Knight" and "nolan" finds
+"Christopher Nolan". Entries live in one sorted list and a prefix lookup is a
+bisect followed by a scan of the matching range, so no database query is needed.
+"""
+
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+
+SUGGEST_KINDS = ("title", "director", "actor")
+RANKINGS = ("rating", "popularity")
+
+# Results for prefixes this short match large parts of the index, so they are
+# memoized until the next change
+MEMO_PREFIX_LENGTH = 3
+
+
+def normalize(text):
+    """Lowercase, strip accents and collapse punctuation/whitespace to single spaces"""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^\w]+", " ", text.lower()).split())
+
+
+def split_names(value):
+    """Names from a comma separated director/actors field, ignoring OMDB's N/A"""
+    return [
+        name.strip()
+        for name in (value or "").split(",")
+        if name.strip() and name.strip() != "N/A"
+    ]
+
+
+def word_keys(text):
+    """Index keys for text: the normalized text from each word onwards"""
+    words = normalize(text).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class SuggestIndex:
+    """
+    Sorted (key, kind, value, movie_id) entries plus per-movie rank data
+    Safe to share between threads. `generation` is the collection generation the
+    index reflects, or None when it is stale and must be rebuilt. A stale index
+    still answers lookups until the rebuild replaces it; `ready` is False only
+    before the first build
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.movie_entries = {}  # movie_id -> its entries, for removal
+        self.ranks = {}  # movie_id -> (rating, votes)
+        self.memo = {}
+        self.generation = None
+        self.ready = False
+        self.lock = threading.RLock()
+
+    def is_current(self, generation):
+        # A replica may lag the primary the index was built from
+        return self.generation is not None and self.generation >= generation
+
+    def invalidate(self):
+        """Mark stale so the next lookup rebuilds from the database"""
+        with self.lock:
+            self.generation = None
+
+    @staticmethod
+    def movie_index_entries(row):
+        """Entries for one movie row (a dict with id, title, director and actors)"""
+        values = [("title", row.get("title"))]
+        values += [("director", name) for name in split_names(row.get("director"))]
+        values += [("actor", name) for name in split_names(row.get("actors"))]
+        return {
+            (key, kind, value, row["id"])
+            for kind, value in values
+            if value
+            for key in word_keys(value)
+        }
+
+    def rebuild(self, rows, generation):
+        """Replace the index with the given movie rows, as of generation"""
+        entries, movie_entries, ranks = [], {}, {}
+        for row in rows:
+            movie_entries[row["id"]] = self.movie_index_entries(row)
+            entries += movie_entries[row["id"]]
+            ranks[row["id"]] = (row.get("rating") or 0, row.get("votes") or 0)
+        entries.sort()
+        with self.lock:
+            self.entries = entries
+            self.movie_entries = movie_entries
+            self.ranks = ranks
+            self.memo = {}
+            self.generation = generation
+            self.ready = True
+
+    def apply(self, changes, from_generation, to_generation):
+        """
+        Apply {movie_id: row or None (deleted)} committed as to_generation
+        If the index isn't at from_generation it missed other writes, so it is
+        marked stale instead
+        """
+        with self.lock:
+            if self.generation is None or self.generation != from_generation:
+                self.generation = None
+                return
+            for movie_id, row in changes.items():
+                for entry in self.movie_entries.pop(movie_id, ()):
+                    i = bisect_left(self.entries, entry)
+                    if i < len(self.entries) and self.entries[i] == entry:
+                        del self.entries[i]
+                self.ranks.pop(movie_id, None)
+                if row is None:
+                    continue
+                self.movie_entries[movie_id] = self.movie_index_entries(row)
+                for entry in self.movie_entries[movie_id]:
+                    insort(self.entries, entry)
+                self.ranks[movie_id] = (row.get("rating") or 0, row.get("votes") or 0)
+            self.memo = {}
+            self.generation = to_generation
+
+    def suggest(self, query, limit=10, by="rating", kinds=SUGGEST_KINDS):
+        """
+        Top suggestions for a prefix, best ranked first
+        Titles are one suggestion per movie; a director or actor is one suggestion
+        ranked by their best movie
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        memo_key = (prefix, limit, by, tuple(kinds))
+        with self.lock:
+            if memo_key in self.memo:
+                return self.memo[memo_key]
+
+            # Every key starting with prefix sorts between these two bounds
+            lo = bisect_left(self.entries, (prefix,))
+            hi = bisect_left(self.entries, (prefix + "\U0010ffff",), lo)
+            matches = {}
+            for _, kind, value, movie_id in self.entries[lo:hi]:
+                if kind not in kinds:
+                    continue
+                group = movie_id if kind == "title" else (kind, value)
+                rank = self.ranks[movie_id]
+                if by == "popularity":
+                    rank = rank[::-1]
+                best = matches.get(group)
+                if best is None:
+                    matches[group] = [rank, kind, value, movie_id, {movie_id}]
+                else:
+                    best[4].add(movie_id)
+                    if rank > best[0]:
+                        best[0], best[3] = rank, movie_id
+
+            ranked = heapq.nsmallest(
+                limit, matches.values(), key=lambda m: (-m[0][0], -m[0][1], m[2])
+            )
+            results = []
+            for _, kind, value, movie_id, movie_ids in ranked:
+                rating, votes = self.ranks.get(movie_id, (0, 0))
+                result = {
+                    "type": kind,
+                    "value": value,
+                    "rating": rating,
+                    "votes": votes,
+                }
+                if kind == "title":
+                    result["movie_id"] = movie_id
+                else:
+                    result["movies"] = len(movie_ids)
+                results.append(result)
+
+            if len(prefix) <= MEMO_PREFIX_LENGTH:
+                self.memo[memo_key] = results
+            return results
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import MovieModal from './components/MovieModal';
 import Navigation from './components/Navigation';
 import CollectionView from './components/CollectionView';
@@ -23,6 +23,9 @@ const getApiBaseUrl = () => {
   return apiUrl;
 };
 
+// Movies whose enhanced details are prefetched when the collection changes
+const ENHANCED_PREFETCH_COUNT = 24;
+
 // User info component
 function UserInfo() {
   const { user, logout } = useAuth();
@@ -54,7 +57,14 @@ function AppContent() {
   const [selectedMovie, setSelectedMovie] = useState(null);
   const [showModal, setShowModal] = useState(false);
   const [stats, setStats] = useState(null);
+  const [topMovies, setTopMovies] = useState({ latest: [], topRated: [] });
+  const [enhancedDetails, setEnhancedDetails] = useState({});
+  const [suggestions, setSuggestions] = useState({ title: [], director: [], actor: [] });
   const [currentView, setCurrentView] = useState('collection');
+  // Collection generation the loaded movies and stats each reflect, see /movies/events.
+  // They are fetched separately, so either may be behind the other
+  const loadedGeneration = useRef({ movies: 0, stats: 0 });
+  const eventSource = useRef(null);
   const [showFilters, setShowFilters] = useState(false);
   const [filters, setFilters] = useState({
     genre: '',
@@ -62,7 +72,9 @@ function AppContent() {
     director: '',
     actor: '',
     title: '',
-    min_rating: ''
+    min_rating: '',
+    tag: '',
+    source: ''
   });
 
   // Fetch all movies on component mount
@@ -71,11 +83,43 @@ function AppContent() {
     fetchStats();
   }, []);
 
+  // Follow changes made by other users and tabs while signed in
+  useEffect(() => {
+    if (!isAuthenticated) {
+      return undefined;
+    }
+    const source = new EventSource(`${getApiBaseUrl()}/movies/events`, { withCredentials: true });
+    eventSource.current = source;
+    source.addEventListener('hello', (e) => {
+      // Sent on every (re)connect; reload if we missed changes in between
+      const { generation } = JSON.parse(e.data);
+      const loaded = oldestLoadedGeneration();
+      const missed = loaded > 0 && generation > loaded;
+      advanceGeneration('movies', generation);
+      advanceGeneration('stats', generation);
+      if (missed) {
+        fetchMovies();
+        fetchStats();
+      }
+    });
+    source.addEventListener('change', (e) => applyChange(JSON.parse(e.data)));
+    return () => {
+      source.close();
+      eventSource.current = null;
+    };
+  }, [isAuthenticated]);
+
   // Update filtered movies when movies or filters change
   useEffect(() => {
     applyFilters();
   }, [movies, filters]);
 
+  // Prefetch stored details for the first page of visible movies in one request.
+  // Missing ones are looked up only when a movie is opened (MovieModal)
+  useEffect(() => {
+    prefetchEnhancedDetails(filteredMovies.slice(0, ENHANCED_PREFETCH_COUNT));
+  }, [filteredMovies]);
+
   const fetchMovies = async () => {
     try {
       setLoading(true);
@@ -87,6 +131,7 @@ function AppContent() {
         throw new Error('Failed to fetch movies');
       }
       const data = await response.json();
+      advanceGeneration('movies', Number(response.headers.get('X-Collection-Generation')));
       setMovies(data);
     } catch (err) {
       setError(err.message);
@@ -102,13 +147,136 @@ function AppContent() {
       });
       if (response.ok) {
         const data = await response.json();
+        advanceGeneration('stats', Number(response.headers.get('X-Collection-Generation')));
         setStats(data);
       }
+      fetchTopMovies();
     } catch (err) {
       console.error('Failed to fetch stats:', err);
     }
   };
 
+  const advanceGeneration = (key, generation) => {
+    if (generation > loadedGeneration.current[key]) {
+      loadedGeneration.current[key] = generation;
+    }
+  };
+
+  const oldestLoadedGeneration = () => Math.min(loadedGeneration.current.movies, loadedGeneration.current.stats);
+
+  const upsertMovie = (changed) => {
+    setMovies(prevMovies => {
+      if (!prevMovies.some(movie => movie.id === changed.id)) {
+        return [...prevMovies, changed];
+      }
+      // Events leave out cast, trailers and similar movies, keep what we have
+      return prevMovies.map(movie => movie.id === changed.id ? { ...movie, ...changed } : movie);
+    });
+  };
+
+  const removeMovie = (movieId) => {
+    setMovies(prevMovies => prevMovies.filter(movie => movie.id !== movieId));
+  };
+
+  const topCounts = (counts, limit) => Object.fromEntries(
+    Object.entries(counts).sort((a, b) => b[1] - a[1]).slice(0, limit)
+  );
+
+  const applyStatsDelta = (delta) => {
+    setStats(prevStats => {
+      if (!prevStats) {
+        return prevStats;
+      }
+      const merged = { ...prevStats, total_movies: prevStats.total_movies + (delta.total_movies || 0) };
+      ['genres', 'decades', 'top_directors'].forEach(key => {
+        const counts = { ...prevStats[key] };
+        Object.entries(delta[key] || {}).forEach(([name, count]) => {
+          counts[name] = (counts[name] || 0) + count;
+          if (counts[name] <= 0) {
+            delete counts[name];
+          }
+        });
+        merged[key] = topCounts(counts, key === 'decades' ? undefined : 10);
+      });
+      return merged;
+    });
+  };
+
+  // One committed transaction from /movies/events
+  const applyChange = (message) => {
+    const { movies: moviesAt, stats: statsAt } = loadedGeneration.current;
+    const loaded = oldestLoadedGeneration();
+    if (message.generation !== null && message.generation <= loaded) {
+      return; // Already reflected in what we loaded
+    }
+    const missed = message.generation === null || message.generation > loaded + 1;
+    advanceGeneration('movies', message.generation || 0);
+    advanceGeneration('stats', message.generation || 0);
+    if (message.invalidate || missed) {
+      fetchMovies();
+      fetchStats();
+      return;
+    }
+    // Only the part that is behind; a stats delta applied twice would double count
+    if (message.generation > moviesAt) {
+      message.changes.forEach(change => {
+        if (change.type === 'deleted') {
+          removeMovie(change.id);
+        } else {
+          upsertMovie(change.movie);
+        }
+      });
+    }
+    if (message.generation > statsAt) {
+      applyStatsDelta(message.stats);
+    }
+    fetchTopMovies();
+  };
+
+  const liveUpdates = () => eventSource.current && eventSource.current.readyState === EventSource.OPEN;
+
+  // Latest and best rated movies are ranked server-side (LIMIT over an index)
+  const fetchTopMovies = async () => {
+    try {
+      const [latestResponse, topRatedResponse] = await Promise.all([
+        fetch(`${getApiBaseUrl()}/movies/top?by=date_added&limit=5`, { credentials: 'include' }),
+        fetch(`${getApiBaseUrl()}/movies/top?by=imdb_rating&limit=5`, { credentials: 'include' }),
+      ]);
+      if (latestResponse.ok && topRatedResponse.ok) {
+        setTopMovies({
+          latest: await latestResponse.json(),
+          topRated: await topRatedResponse.json(),
+        });
+      }
+    } catch (err) {
+      console.error('Failed to fetch top movies:', err);
+    }
+  };
+
+  const prefetchEnhancedDetails = async (visibleMovies) => {
+    const ids = visibleMovies.map(movie => movie.id).filter(id => !enhancedDetails[id]);
+    if (ids.length === 0) {
+      return;
+    }
+    try {
+      const response = await fetch(`${getApiBaseUrl()}/movies/enhanced?ids=${ids.join(',')}&lookup=0`, {
+        credentials: 'include',
+      });
+      if (response.ok) {
+        const data = await response.json();
+        setEnhancedDetails(prev => {
+          const next = { ...prev };
+          data.movies.forEach(movie => {
+            next[movie.id] = movie;
+          });
+          return next;
+        });
+      }
+    } catch (err) {
+      console.error('Failed to prefetch movie details:', err);
+    }
+  };
+
   const applyFilters = async () => {
     // If no filters are applied, show all movies
     const hasFilters = Object.values(filters).some(filter => filter.trim() !== '');
@@ -144,6 +312,29 @@ function AppContent() {
       ...prev,
       [key]: value
     }));
+    if (key === 'title' || key === 'director' || key === 'actor') {
+      fetchSuggestions(key, value);
+    }
+  };
+
+  // Typeahead for the title/director/actor filters, served from an in-memory index
+  const fetchSuggestions = async (type, query) => {
+    if (!query.trim()) {
+      setSuggestions(prev => ({ ...prev, [type]: [] }));
+      return;
+    }
+    try {
+      const params = new URLSearchParams({ q: query, type, limit: 8 });
+      const response = await fetch(`${getApiBaseUrl()}/movies/suggest?${params}`, {
+        credentials: 'include',
+      });
+      if (response.ok) {
+        const data = await response.json();
+        setSuggestions(prev => ({ ...prev, [type]: [...new Set(data.map(suggestion => suggestion.value))] }));
+      }
+    } catch (err) {
+      console.error('Failed to fetch suggestions:', err);
+    }
   };
 
   const clearFilters = () => {
@@ -153,7 +344,9 @@ function AppContent() {
       director: '',
       actor: '',
       title: '',
-      min_rating: ''
+      min_rating: '',
+      tag: '',
+      source: ''
     });
   };
 
@@ -180,8 +373,10 @@ function AppContent() {
         throw new Error(errorData.error || 'Movie not found');
       }
       const newMovie = await response.json();
-      setMovies(prevMovies => [...prevMovies, newMovie]);
-      fetchStats(); // Update stats after adding new movie
+      upsertMovie(newMovie);
+      if (!liveUpdates()) {
+        fetchStats(); // Otherwise the change event updates stats
+      }
       showSuccess(`"${newMovie.title}" added to your collection!`);
       return { success: true, movie: newMovie };
     } catch (err) {
@@ -225,9 +420,11 @@ function AppContent() {
       if (!response.ok) {
         throw new Error('Failed to delete movie');
       }
-      setMovies(prevMovies => prevMovies.filter(movie => movie.id !== movieId));
+      removeMovie(movieId);
       setShowModal(false);
-      fetchStats(); // Update stats after deleting movie
+      if (!liveUpdates()) {
+        fetchStats(); // Otherwise the change event updates stats
+      }
       showSuccess('Movie deleted from collection');
       return { success: true };
     } catch (err) {
@@ -271,6 +468,7 @@ function AppContent() {
             onUpdateMovie={updateMovie}
             filters={filters}
             onFilterChange={updateFilter}
+            suggestions={suggestions}
             onClearFilters={clearFilters}
             showFilters={showFilters}
             onToggleFilters={toggleFilters}
@@ -279,7 +477,7 @@ function AppContent() {
       case 'search':
         return <SearchView onSearch={searchMovie} />;
       case 'statistics':
-        return <StatisticsView stats={stats} movies={movies} />;
+        return <StatisticsView stats={stats} movies={movies} topMovies={topMovies} />;
       default:
         return (
           <CollectionView
@@ -290,6 +488,7 @@ function AppContent() {
             onUpdateMovie={updateMovie}
             filters={filters}
             onFilterChange={updateFilter}
+            suggestions={suggestions}
             onClearFilters={clearFilters}
             showFilters={showFilters}
             onToggleFilters={toggleFilters}
@@ -361,6 +560,7 @@ function AppContent() {
       {showModal && selectedMovie && (
         <MovieModal 
           movie={selectedMovie}
+          prefetched={enhancedDetails[selectedMovie.id]}
           onClose={closeModal}
           onDelete={deleteMovie}
           onUpdate={updateMovie}
@@ -10,6 +10,7 @@ function CollectionView({
   onUpdateMovie,
   filters,
   onFilterChange,
+  suggestions,
   onClearFilters,
   showFilters,
   onToggleFilters
@@ -38,6 +39,7 @@ function CollectionView({
         <MovieFilters 
           filters={filters}
           onFilterChange={onFilterChange}
+          suggestions={suggestions}
           onClearFilters={onClearFilters}
         />
       )}
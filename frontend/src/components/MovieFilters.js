@@ -1,6 +1,6 @@
 import React from 'react';
 
-function MovieFilters({ filters, onFilterChange, onClearFilters }) {
+function MovieFilters({ filters, onFilterChange, onClearFilters, suggestions = {} }) {
   const currentYear = new Date().getFullYear();
   const years = Array.from({ length: currentYear - 1900 }, (_, i) => currentYear - i);
 
@@ -20,10 +20,16 @@ function MovieFilters({ filters, onFilterChange, onClearFilters }) {
             type="text"
             value={filters.title}
             onChange={(e) => onFilterChange('title', e.target.value)}
+            list="title-suggestions"
             placeholder="Search by title..."
             className="search-input"
             style={{ width: '100%' }}
           />
+          <datalist id="title-suggestions">
+            {(suggestions.title || []).map(value => (
+              <option key={value} value={value} />
+            ))}
+          </datalist>
         </div>
 
         <div>
@@ -44,10 +50,16 @@ function MovieFilters({ filters, onFilterChange, onClearFilters }) {
             type="text"
             value={filters.director}
             onChange={(e) => onFilterChange('director', e.target.value)}
+            list="director-suggestions"
             placeholder="Director name..."
             className="search-input"
             style={{ width: '100%' }}
           />
+          <datalist id="director-suggestions">
+            {(suggestions.director || []).map(value => (
+              <option key={value} value={value} />
+            ))}
+          </datalist>
         </div>
 
         <div>
@@ -56,10 +68,16 @@ function MovieFilters({ filters, onFilterChange, onClearFilters }) {
             type="text"
             value={filters.actor}
             onChange={(e) => onFilterChange('actor', e.target.value)}
+            list="actor-suggestions"
             placeholder="Actor name..."
             className="search-input"
             style={{ width: '100%' }}
           />
+          <datalist id="actor-suggestions">
+            {(suggestions.actor || []).map(value => (
+              <option key={value} value={value} />
+            ))}
+          </datalist>
         </div>
 
         <div>
@@ -93,6 +111,30 @@ function MovieFilters({ filters, onFilterChange, onClearFilters }) {
             <option value="5.0">5.0+ (Average)</option>
           </select>
         </div>
+
+        <div>
+          <label style={{ display: 'block', marginBottom: '5px', fontWeight: '600' }}>Tags</label>
+          <input
+            type="text"
+            value={filters.tag}
+            onChange={(e) => onFilterChange('tag', e.target.value)}
+            placeholder="e.g., favorite, watchlist"
+            className="search-input"
+            style={{ width: '100%' }}
+          />
+        </div>
+
+        <div>
+          <label style={{ display: 'block', marginBottom: '5px', fontWeight: '600' }}>Source</label>
+          <input
+            type="text"
+            value={filters.source}
+            onChange={(e) => onFilterChange('source', e.target.value)}
+            placeholder="e.g., UHD Disk"
+            className="search-input"
+            style={{ width: '100%' }}
+          />
+        </div>
       </div>
 
       {hasActiveFilters && (
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 
-function MovieModal({ movie, onClose, onDelete, onUpdate }) {
+function MovieModal({ movie, prefetched, onClose, onDelete, onUpdate }) {
   const [notes, setNotes] = useState(movie.notes || '');
   const [tags, setTags] = useState(movie.tags || '');
   const [sources, setSources] = useState(movie.sources || []);
@@ -9,8 +9,19 @@ function MovieModal({ movie, onClose, onDelete, onUpdate }) {
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('overview');
 
-  // Fetch enhanced movie data on component mount
+  // Use prefetched enhanced data if available, otherwise fetch it on mount
   useEffect(() => {
+    // Extract TMDB data from the movie object
+    const toEnhancedData = (data) => ({
+      tmdb_id: data.tmdb_id,
+      backdrop_url: data.backdrop_url,
+      tmdb_rating: data.tmdb_rating,
+      tmdb_vote_count: data.tmdb_vote_count,
+      cast: data.cast_data || [],
+      trailers: data.trailers_data || [],
+      similar_movies: data.similar_movies_data || []
+    });
+
     const fetchEnhancedData = async () => {
       try {
         // Dynamic API URL detection
@@ -31,16 +42,7 @@ function MovieModal({ movie, onClose, onDelete, onUpdate }) {
         });
         if (response.ok) {
           const data = await response.json();
-          // Extract TMDB data from the movie object
-          setEnhancedData({
-            tmdb_id: data.tmdb_id,
-            backdrop_url: data.backdrop_url,
-            tmdb_rating: data.tmdb_rating,
-            tmdb_vote_count: data.tmdb_vote_count,
-            cast: data.cast_data || [],
-            trailers: data.trailers_data || [],
-            similar_movies: data.similar_movies_data || []
-          });
+          setEnhancedData(toEnhancedData(data));
         }
       } catch (error) {
         console.error('Failed to fetch enhanced movie data:', error);
@@ -49,8 +51,13 @@ function MovieModal({ movie, onClose, onDelete, onUpdate }) {
       }
     };
 
+    if (prefetched && prefetched.tmdb_id) {
+      setEnhancedData(toEnhancedData(prefetched));
+      setLoading(false);
+      return;
+    }
     fetchEnhancedData();
-  }, [movie.id]);
+  }, [movie.id, prefetched]);
 
   const handleDelete = async () => {
     if (window.confirm(`Are you sure you want to delete "${movie.title}"?`)) {
@@ -1,7 +1,7 @@
 import React from 'react';
 import MovieStats from './MovieStats';
 
-function StatisticsView({ stats, movies }) {
+function StatisticsView({ stats, movies, topMovies = { latest: [], topRated: [] } }) {
   if (!stats || !movies) {
     return (
       <div className="loading">
@@ -33,14 +33,9 @@ function StatisticsView({ stats, movies }) {
     ? (movies.reduce((sum, movie) => sum + (movie.personal_rating || 0), 0) / personallyRated).toFixed(1)
     : 0;
 
-  const latestMovies = movies
-    .sort((a, b) => new Date(b.date_added) - new Date(a.date_added))
-    .slice(0, 5);
-
-  const topRatedMovies = movies
-    .filter(m => m.imdb_score && m.imdb_score !== 'N/A')
-    .sort((a, b) => parseFloat(b.imdb_score) - parseFloat(a.imdb_score))
-    .slice(0, 5);
+  // Ranked by the backend (/movies/top)
+  const latestMovies = topMovies.latest;
+  const topRatedMovies = topMovies.topRated;
 
   return (
     <div>